@@ -0,0 +1,6 @@
+"""Micro-benchmarks for dev_utils hot paths.
+
+Each ``bench_*`` module is runnable on its own, e.g. ``python -m benchmarks.bench_results``, and
+prints comparison with previous implementations. All modules together form regression suite,
+see ``benchmarks.suite`` and ``make bench_check``.
+"""
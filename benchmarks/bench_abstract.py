@@ -0,0 +1,219 @@
+"""Benchmark ``dev_utils.abstract`` subclass creation.
+
+Run with ``python -m benchmarks.bench_abstract``.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from typing import Any
+from warnings import warn
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.abstract import (
+    DEFERRED_VALIDATION_ENV,
+    Abstract,
+    AbstractClassWithoutAbstractPropertiesWarning,
+    _AbstractClassProperty,
+    abstract_class_property,
+    validate_abstract_classes,
+)
+
+HIERARCHIES = 10
+DEPTH = 50
+ATTRIBUTES = 20
+ABSTRACT_PROPERTIES = 5
+
+
+class _LegacyAbstractClassProperty(_AbstractClassProperty[Any]):
+    def __set_name__(self, containing_klass: type[Any], name: str) -> None:
+        object.__setattr__(self, "__name__", name)
+        object.__setattr__(self, "__containing_klass_name__", containing_klass.__name__)
+
+
+class PlainBase:
+    """Base class without any subclass checks."""
+
+
+def _plain_property(propertytype: type[Any]) -> type[Any]:
+    return propertytype
+
+
+class LegacyAbstract:
+    """Copy of ``Abstract`` with ``dir`` based subclass check."""
+
+    __skip_abstract_raise_error__: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401, D105
+        super().__init_subclass__(**kwargs)
+        if cls.__skip_abstract_raise_error__:
+            cls.__skip_abstract_raise_error__ = False
+            return
+        if LegacyAbstract in cls.__bases__:
+            for name in dir(cls):
+                if name.startswith("__") and name.endswith("__"):
+                    continue
+                if isinstance(getattr(cls, name), _AbstractClassProperty):
+                    break
+            else:
+                msg = f"Class {cls.__name__} is defined as abstract."
+                warn(AbstractClassWithoutAbstractPropertiesWarning(msg), stacklevel=2)
+        else:
+            for name in dir(cls):
+                if name.startswith("__") and name.endswith("__"):
+                    continue
+                if isinstance(getattr(cls, name), _AbstractClassProperty):
+                    msg = f"Class {cls.__name__} must define abstract class property {name}."
+                    raise TypeError(msg)
+
+
+def build_hierarchies(
+    abstract: type[Any],
+    make_property: Any,  # noqa: ANN401
+) -> list[type[Any]]:
+    """Build abstract roots with deep chains of subclasses with many attributes each."""
+    classes: list[type[Any]] = []
+    for hierarchy in range(HIERARCHIES):
+        root = type(
+            f"Root{hierarchy}",
+            (abstract,),
+            {f"prop_{i}": make_property(str) for i in range(ABSTRACT_PROPERTIES)},
+        )
+        parent = type(
+            f"Concrete{hierarchy}",
+            (root,),
+            {f"prop_{i}": "value" for i in range(ABSTRACT_PROPERTIES)},
+        )
+        classes.extend((root, parent))
+        for level in range(DEPTH):
+            namespace: dict[str, Any] = {f"attr_{level}_{i}": i for i in range(ATTRIBUTES)}
+            namespace[f"method_{level}"] = lambda self: self
+            parent = type(f"Level{hierarchy}_{level}", (parent,), namespace)
+            classes.append(parent)
+    return classes
+
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+from benchmarks.bench_abstract import build_hierarchies, {abstract}, {make_property}
+build_hierarchies({abstract}, {make_property})
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _measure_import(
+    abstract: str,
+    make_property: str,
+    *,
+    deferred: bool = False,
+    repeat: int = 5,
+) -> float:
+    script = IMPORT_SCRIPT.format(abstract=abstract, make_property=make_property)
+    environ = {**os.environ, DEFERRED_VALIDATION_ENV: "true" if deferred else "false"}
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            env=environ,
+        )
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    classes = HIERARCHIES * (DEPTH + 2)
+    os.environ[DEFERRED_VALIDATION_ENV] = "true"
+    deferred = measure(lambda: build_hierarchies(Abstract, abstract_class_property), number=1)
+    validate_abstract_classes()  # NOTE: drop classes, built by measure runs.
+    build_hierarchies(Abstract, abstract_class_property)
+    start = time.perf_counter()
+    validate_abstract_classes()
+    batch = (time.perf_counter() - start) * 1e9
+    os.environ[DEFERRED_VALIDATION_ENV] = "false"
+    print_table(
+        f"build {classes} classes ({HIERARCHIES} hierarchies, depth {DEPTH}, "
+        f"{ATTRIBUTES} attributes per class)",
+        [
+            (
+                "plain classes without checks",
+                measure(lambda: build_hierarchies(PlainBase, _plain_property), number=1) / 1e6,
+            ),
+            (
+                "legacy dir() scan",
+                measure(
+                    lambda: build_hierarchies(LegacyAbstract, _LegacyAbstractClassProperty),
+                    number=1,
+                )
+                / 1e6,
+            ),
+            (
+                "registry",
+                measure(lambda: build_hierarchies(Abstract, abstract_class_property), number=1)
+                / 1e6,
+            ),
+            ("registry, deferred validation", deferred / 1e6),
+            ("validate_abstract_classes batch", batch / 1e6),
+        ],
+        unit="ms",
+    )
+    print_table(
+        "new interpreter: import + build hierarchies",
+        [
+            (
+                "legacy dir() scan",
+                _measure_import("LegacyAbstract", "_LegacyAbstractClassProperty"),
+            ),
+            ("registry", _measure_import("Abstract", "abstract_class_property")),
+            (
+                "registry, deferred validation",
+                _measure_import("Abstract", "abstract_class_property", deferred=True),
+            ),
+        ],
+        unit="ms",
+    )
+
+
+def _build_classes(count: int) -> None:
+    root = type(
+        "Root",
+        (Abstract,),
+        {f"prop_{i}": abstract_class_property(str) for i in range(ABSTRACT_PROPERTIES)},
+    )
+    concrete = type("Concrete", (root,), {f"prop_{i}": "value" for i in range(ABSTRACT_PROPERTIES)})
+    parent = concrete
+    for index in range(count):
+        # NOTE: chains of limited depth, because MRO of very deep chains grows quadratically.
+        if index % DEPTH == 0:
+            parent = concrete
+        namespace = {f"attr_{i}": i for i in range(ATTRIBUTES)}
+        parent = type(f"Level{index}", (parent,), namespace)
+
+
+def _build_classes_deferred(count: int) -> None:
+    previous = os.environ.get(DEFERRED_VALIDATION_ENV)
+    os.environ[DEFERRED_VALIDATION_ENV] = "true"
+    try:
+        _build_classes(count)
+    finally:
+        if previous is None:
+            del os.environ[DEFERRED_VALIDATION_ENV]
+        else:
+            os.environ[DEFERRED_VALIDATION_ENV] = previous
+    validate_abstract_classes()
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that create ``size`` subclasses each."""
+    yield "subclasses", lambda: _build_classes(size)
+    yield "subclasses, deferred validation", lambda: _build_classes_deferred(size)
+
+
+if __name__ == "__main__":
+    main()
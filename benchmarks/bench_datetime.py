@@ -0,0 +1,107 @@
+"""Benchmark ``dev_utils.common.datetime`` functions.
+
+Run with ``python -m benchmarks.bench_datetime``.
+"""
+
+import datetime
+from collections.abc import Callable, Iterator
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.common.datetime import (
+    CoarseUTCClock,
+    UTCISOCodec,
+    get_coarse_utc_now,
+    get_utc_now,
+)
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _bench_isoformat(count: int) -> None:
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    # NOTE: log-like timestamps: about 27 values per second.
+    datetimes = [start + datetime.timedelta(microseconds=i * 37_000) for i in range(count)]
+    epochs = [(value - EPOCH) // MICROSECOND for value in datetimes]
+    strings = [value.isoformat() for value in datetimes]
+    codec = UTCISOCodec()
+
+    def bench(func: Callable[[], object]) -> float:
+        return measure(func, number=1, repeat=3) / 1e6
+
+    print_table(
+        f"format {count} UTC timestamps",
+        [
+            (
+                "[isoformat() for datetimes]",
+                bench(lambda: [value.isoformat() for value in datetimes]),
+            ),
+            ("UTCISOCodec.format_many", bench(lambda: codec.format_many(datetimes))),
+            (
+                "[fromtimestamp().isoformat() for epochs]",
+                bench(
+                    lambda: [
+                        datetime.datetime.fromtimestamp(value / 1e6, datetime.UTC).isoformat()
+                        for value in epochs
+                    ],
+                ),
+            ),
+            ("UTCISOCodec.format_epoch_us_many", bench(lambda: codec.format_epoch_us_many(epochs))),
+        ],
+        unit="ms",
+    )
+    print_table(
+        f"parse {count} UTC timestamps",
+        [
+            (
+                "[fromisoformat() for strings]",
+                bench(lambda: [datetime.datetime.fromisoformat(value) for value in strings]),
+            ),
+            ("UTCISOCodec.parse_many", bench(lambda: codec.parse_many(strings))),
+            (
+                "[(fromisoformat() - epoch) // 1us]",
+                bench(
+                    lambda: [
+                        (datetime.datetime.fromisoformat(value) - EPOCH) // MICROSECOND
+                        for value in strings
+                    ],
+                ),
+            ),
+            ("UTCISOCodec.parse_epoch_us_many", bench(lambda: codec.parse_epoch_us_many(strings))),
+        ],
+        unit="ms",
+    )
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    millisecond_clock = CoarseUTCClock(0.001)
+    second_clock = CoarseUTCClock(1)
+    print_table(
+        "current UTC datetime",
+        [
+            ("get_utc_now", measure(get_utc_now)),
+            ("get_coarse_utc_now (1 ms)", measure(get_coarse_utc_now)),
+            ("CoarseUTCClock(0.001).now", measure(millisecond_clock.now)),
+            ("CoarseUTCClock(1).now", measure(second_clock.now)),
+        ],
+    )
+    _bench_isoformat(1_000_000)
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    datetimes = [start + datetime.timedelta(microseconds=i * 37_000) for i in range(size)]
+    epochs = [(value - EPOCH) // MICROSECOND for value in datetimes]
+    strings = [value.isoformat() for value in datetimes]
+    codec = UTCISOCodec()
+    yield "get_coarse_utc_now", lambda: [get_coarse_utc_now() for _ in range(size)]
+    yield "UTCISOCodec.format_many", lambda: codec.format_many(datetimes)
+    yield "UTCISOCodec.format_epoch_us_many", lambda: codec.format_epoch_us_many(epochs)
+    yield "UTCISOCodec.parse_many", lambda: codec.parse_many(strings)
+    yield "UTCISOCodec.parse_epoch_us_many", lambda: codec.parse_epoch_us_many(strings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Benchmark ``dev_utils.common.envs`` getters.
+
+Run with ``python -m benchmarks.bench_envs``.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.common.envs import (
+    EnvConfigLoader,
+    EnvField,
+    EnvSnapshot,
+    getenv_bool,
+    getenv_int,
+    getenv_list,
+    parse_dotenv,
+)
+
+
+def _legacy_getenv_list(key: str, default: str = "", separator: str = ",") -> list[str]:
+    value = os.getenv(key, default)
+    if separator not in value and not value.isalnum():
+        return []
+    result_list = [x.strip() for x in value.strip().split(separator)]
+    return list(filter(lambda x: x, result_list))
+
+
+def _legacy_getenv_bool(key: str, default: str = "") -> bool:
+    return os.getenv(key, default).lower() in ("1", "true", "yes", "t")
+
+
+def _legacy_getenv_int(key: str, default: int | None = None) -> int | None:
+    value = os.getenv(key, "")
+    try:
+        return int(float(value))
+    except ValueError:
+        return default
+
+
+FIELDS_COUNT = 100
+_FIELD_TYPES = ("int", "bool", "str", "list")
+
+DEV_UTILS_CONFIG_SCRIPT = f"""
+from dev_utils.common.envs import EnvConfigLoader, EnvField
+spec = {{f"field_{{i}}": EnvField({{"int": int, "bool": bool, "str": str, "list": list}}[t])
+        for i, t in enumerate({_FIELD_TYPES!r} * {FIELDS_COUNT // len(_FIELD_TYPES)})}}
+EnvConfigLoader(spec, prefix="BENCH_").load()
+"""
+
+PYDANTIC_CONFIG_SCRIPT = f"""
+from pydantic_settings import BaseSettings, SettingsConfigDict
+annotations = {{f"field_{{i}}": {{"int": int, "bool": bool, "str": str, "list": list[str]}}[t]
+               for i, t in enumerate({_FIELD_TYPES!r} * {FIELDS_COUNT // len(_FIELD_TYPES)})}}
+Config = type("Config", (BaseSettings,), {{
+    "__annotations__": annotations,
+    "model_config": SettingsConfigDict(env_prefix="BENCH_"),
+}})
+Config()
+"""
+
+
+def _bench_env() -> dict[str, str]:
+    environ = dict(os.environ)
+    for i in range(FIELDS_COUNT):
+        value = ("42", "true", "some text", "a,b,c")[i % len(_FIELD_TYPES)]
+        if i % len(_FIELD_TYPES) == len(_FIELD_TYPES) - 1:
+            value = '["a","b","c"]'  # pydantic-settings parses complex types as json.
+        environ[f"BENCH_FIELD_{i}"] = value
+    return environ
+
+
+def measure_script(script: str, *, repeat: int = 5) -> float | None:
+    """Measure best wall time of running given script in new interpreter in milliseconds."""
+    environ = _bench_env()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            env=environ,
+            capture_output=True,
+            check=False,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        if completed.returncode != 0:
+            return None
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _line_by_line_parse_dotenv(path: Path) -> dict[str, str]:
+    result: dict[str, str] = {}
+    with path.open() as file:
+        for raw_line in file:
+            line = raw_line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.removeprefix("export ").split("=", 1)
+            result[key.strip()] = value.strip().strip("'\"")
+    return result
+
+
+def _bench_dotenv(lines: int) -> list[tuple[str, float]]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / ".env"
+        with path.open("w") as file:
+            for i in range(lines):
+                file.write(f"# variable {i}\n")
+                file.write(f'export VAR_{i}="value number {i}"\n' if i % 2 else f"VAR_{i}={i}\n")
+        rows = [
+            (
+                "parse_dotenv (mmap + regex)",
+                measure(lambda: parse_dotenv(path), number=1, repeat=3),
+            ),
+            ("line by line", measure(lambda: _line_by_line_parse_dotenv(path), number=1, repeat=3)),
+        ]
+        try:
+            from dotenv import dotenv_values  # type: ignore reportMissingImports  # noqa: PLC0415
+        except ImportError:
+            print("\npython-dotenv is not installed: skip it.")  # noqa: T201
+        else:
+            rows.append(
+                (
+                    "python-dotenv (interpolate=False)",
+                    measure(lambda: dotenv_values(path, interpolate=False), number=1, repeat=3),
+                ),
+            )
+    return rows
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    os.environ["BENCH_LIST"] = "alpha, beta, gamma, delta, epsilon, zeta, eta, theta"
+    os.environ["BENCH_BOOL"] = "true"
+    os.environ["BENCH_INT"] = "12345"
+    snapshot = EnvSnapshot()
+    print_table(
+        "typed env lookups",
+        [
+            ("legacy getenv_list", measure(lambda: _legacy_getenv_list("BENCH_LIST"))),
+            ("getenv_list (live)", measure(lambda: getenv_list("BENCH_LIST"))),
+            ("EnvSnapshot.get_list", measure(lambda: snapshot.get_list("BENCH_LIST"))),
+            ("legacy getenv_bool", measure(lambda: _legacy_getenv_bool("BENCH_BOOL"))),
+            ("getenv_bool (live)", measure(lambda: getenv_bool("BENCH_BOOL"))),
+            ("EnvSnapshot.get_bool", measure(lambda: snapshot.get_bool("BENCH_BOOL"))),
+            ("legacy getenv_int", measure(lambda: _legacy_getenv_int("BENCH_INT"))),
+            ("getenv_int (live)", measure(lambda: getenv_int("BENCH_INT"))),
+            ("EnvSnapshot.get_int", measure(lambda: snapshot.get_int("BENCH_INT"))),
+        ],
+    )
+
+    print_table("parse .env with 100k variables", _bench_dotenv(100_000))
+    empty = measure_script("pass")
+    dev_utils_time = measure_script(DEV_UTILS_CONFIG_SCRIPT)
+    pydantic_time = measure_script(PYDANTIC_CONFIG_SCRIPT)
+    rows = [("bare interpreter", empty), ("EnvConfigLoader", dev_utils_time)]
+    if pydantic_time is None:
+        print("\npydantic-settings is not installed: skip it.")  # noqa: T201
+    else:
+        rows.append(("pydantic-settings", pydantic_time))
+    print_table(
+        f"import + load config with {FIELDS_COUNT} fields",
+        [(name, value) for name, value in rows if value is not None],
+        unit="ms",
+    )
+
+
+def _write_dotenv(path: Path, lines: int) -> None:
+    with path.open("w") as file:
+        for i in range(lines):
+            file.write(f"# variable {i}\n")
+            file.write(f'export VAR_{i}="value number {i}"\n' if i % 2 else f"VAR_{i}={i}\n")
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    os.environ["BENCH_BOOL"] = "true"
+    environ = {f"BENCH_FIELD_{i}": ("42", "true", "some text", "a,b,c")[i % 4] for i in range(size)}
+    snapshot = EnvSnapshot(environ)
+    keys = list(environ)
+    loader = EnvConfigLoader(
+        {f"field_{i}": EnvField((int, bool, str, list)[i % 4]) for i in range(size)},
+        prefix="BENCH_",
+    )
+    yield "getenv_bool", lambda: [getenv_bool("BENCH_BOOL") for _ in range(size)]
+    yield "EnvSnapshot.get_int", lambda: list(map(snapshot.get_int, keys))
+    yield "EnvSnapshot.get_list", lambda: list(map(snapshot.get_list, keys))
+    yield "EnvConfigLoader.load", lambda: loader.load(environ)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / ".env"
+        _write_dotenv(path, size)
+        yield "parse_dotenv", lambda: parse_dotenv(path)
+
+
+if __name__ == "__main__":
+    main()
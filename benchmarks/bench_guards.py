@@ -0,0 +1,218 @@
+"""Benchmark ``dev_utils.guards`` deep type guards.
+
+Run with ``python -m benchmarks.bench_guards``.
+"""
+
+import array
+from collections.abc import Iterator
+from typing import Any, TypedDict, get_args, get_origin, get_type_hints, is_typeddict
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.guards import (
+    StrKeyDict,
+    StrList,
+    all_dict_keys_are_str,
+    all_elements_are,
+    all_elements_in_sequence_are_str,
+    compile_guard,
+    find_type_errors,
+)
+
+
+class User(TypedDict):
+    """Some API payload item."""
+
+    id: int
+    name: str
+    tags: list[str]
+
+
+def _naive_is_instance(value: Any, hint: Any) -> bool:  # noqa: ANN401
+    """Check value against type hint with ``typing`` introspection for each element."""
+    if is_typeddict(hint):
+        return isinstance(value, dict) and all(
+            name in value and _naive_is_instance(value[name], field)
+            for name, field in get_type_hints(hint).items()
+        )
+    origin = get_origin(hint)
+    if origin is None:
+        return isinstance(value, hint)
+    args = get_args(hint)
+    if not isinstance(value, origin):
+        return False
+    if origin is dict:
+        return all(
+            _naive_is_instance(key, args[0]) and _naive_is_instance(item, args[1])
+            for key, item in value.items()
+        )
+    return all(_naive_is_instance(item, args[0]) for item in value)
+
+
+def _pydantic_validator(hint: Any) -> "Any | None":  # noqa: ANN401
+    try:
+        from pydantic import ConfigDict, TypeAdapter  # noqa: PLC0415
+    except ImportError:
+        return None
+    try:
+        return TypeAdapter(hint, config=ConfigDict(strict=True)).validate_python
+    except Exception:  # noqa: BLE001
+        # NOTE: for example, pydantic does not accept ``typing.TypedDict`` on Python < 3.12.
+        return None
+
+
+def _legacy_all_elements_in_sequence_are_str(value: Any) -> bool:  # noqa: ANN401
+    if isinstance(value, str):
+        return True
+    return all(isinstance(ele, str) for ele in value)
+
+
+def _bench_typed_containers() -> None:
+    size = 1_000_000
+    containers: list[tuple[str, Any]] = [
+        ("array('u')", array.array("u", "a" * size)),
+        ("list[str]", ["a"] * size),
+    ]
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError:
+        print("\nnumpy is not installed: skip it.")  # noqa: T201
+    else:
+        containers.append(("numpy str array", np.array(["a"] * size)))
+    rows: list[tuple[str, float]] = []
+    for name, value in containers:
+        rows.append(
+            (
+                f"legacy ({name})",
+                measure(
+                    lambda value=value: _legacy_all_elements_in_sequence_are_str(value),
+                    number=1,
+                ),
+            ),
+        )
+        rows.append(
+            (
+                f"all_elements_in_sequence_are_str ({name})",
+                measure(lambda value=value: all_elements_in_sequence_are_str(value), number=1),
+            ),
+        )
+    values = ["a"] * size
+    rows.append(
+        (
+            "all_elements_are (list[str], sample_size=1000)",
+            measure(lambda: all_elements_are(values, str, sample_size=1000), number=1),
+        ),
+    )
+    print_table(f"str guards on {size} elements", [(n, v / 1e3) for n, v in rows], unit="us")
+
+
+def _bench_validated_containers() -> None:
+    size = 100_000
+    keys = [f"key_{i}" for i in range(size)]
+    items = dict.fromkeys(keys, 1)
+    print_table(
+        f"build containers with {size} elements",
+        [
+            ("dict(items)", measure(lambda: dict(items), number=10) / 1e3),
+            ("StrKeyDict(items)", measure(lambda: StrKeyDict(items), number=10) / 1e3),
+            ("list(keys)", measure(lambda: list(keys), number=10) / 1e3),
+            ("StrList(keys)", measure(lambda: StrList(keys), number=10) / 1e3),
+        ],
+        unit="us",
+    )
+    plain_dict, str_key_dict = {}, StrKeyDict[int]()
+    plain_list, str_list = [], StrList()
+    print_table(
+        "insert one element",
+        [
+            ("dict[key] = value", measure(lambda: plain_dict.__setitem__("key", 1))),
+            ("StrKeyDict[key] = value", measure(lambda: str_key_dict.__setitem__("key", 1))),
+            ("list.append", measure(lambda: plain_list.append("a"), number=10_000)),
+            ("StrList.append", measure(lambda: str_list.append("a"), number=10_000)),
+        ],
+    )
+    str_key_dict, str_list = StrKeyDict(items), StrList(keys)
+    print_table(
+        f"guards on containers with {size} elements",
+        [
+            (
+                "all_dict_keys_are_str(dict)",
+                measure(lambda: all_dict_keys_are_str(items), number=10),
+            ),
+            (
+                "all_dict_keys_are_str(StrKeyDict)",
+                measure(lambda: all_dict_keys_are_str(str_key_dict)),
+            ),
+            (
+                "all_elements_in_sequence_are_str(list)",
+                measure(lambda: all_elements_in_sequence_are_str(keys), number=10),
+            ),
+            (
+                "all_elements_in_sequence_are_str(StrList)",
+                measure(lambda: all_elements_in_sequence_are_str(str_list)),
+            ),
+        ],
+    )
+
+
+def _catch_validation_error(validate: Any) -> Any:  # noqa: ANN401
+    def wrapper(payload: Any) -> bool:  # noqa: ANN401
+        try:
+            validate(payload)
+        except ValueError:
+            return False
+        return True
+
+    return wrapper
+
+
+def _bench(title: str, hint: Any, payload: Any) -> None:  # noqa: ANN401
+    guard = compile_guard(hint)
+    rows = [
+        (
+            "naive typing introspection",
+            measure(lambda: _naive_is_instance(payload, hint), number=3),
+        ),
+        ("compile_guard", measure(lambda: guard(payload), number=3)),
+    ]
+    validate = _pydantic_validator(hint)
+    if validate is not None:
+        # NOTE: pydantic raises ValidationError on invalid payloads.
+        validate = _catch_validation_error(validate)
+        rows.append(("pydantic TypeAdapter (strict)", measure(lambda: validate(payload), number=3)))
+    print_table(title, [(name, value / 1e3) for name, value in rows], unit="us")
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    _bench(
+        "dict[str, list[int]] with 100k ints",
+        dict[str, list[int]],
+        {f"key_{i}": list(range(100)) for i in range(1000)},
+    )
+    users = [{"id": i, "name": f"user {i}", "tags": ["a", "b"]} for i in range(100_000)]
+    _bench("list[User] with 100k items", list[User], users)
+    _bench("list[int] with 100k ints, invalid first", list[int], ["0", *range(1, 100_000)])
+    _bench_typed_containers()
+    _bench_validated_containers()
+    print_table(
+        "compile type hint",
+        [("compile_guard (cached)", measure(lambda: compile_guard(list[User])))],
+    )
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    users = [{"id": i, "name": "name", "tags": ["a", "b"]} for i in range(size)]
+    strings = ["a"] * size
+    mapping = {f"key_{i}": i for i in range(size)}
+    guard = compile_guard(list[User])
+    yield "compile_guard(list[User])", lambda: guard(users)
+    yield "find_type_errors(list[User])", lambda: find_type_errors(list[User], users)
+    yield "all_elements_are(list[str])", lambda: all_elements_are(strings, str)
+    yield "all_dict_keys_are_str", lambda: all_dict_keys_are_str(mapping)
+    yield "StrList", lambda: StrList(strings)
+    yield "StrKeyDict", lambda: StrKeyDict(mapping)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark ``dev_utils.common.humanize`` functions.
+
+Run with ``python -m benchmarks.bench_humanize``.
+"""
+
+import array
+import random
+from collections.abc import Iterator
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.common.humanize import parse_size, parse_sizes, sizeof_fmt, sizeof_fmt_many
+
+SIZES_COUNT = 100_000
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    random.seed(0)
+    sizes = [random.randint(0, 1024**5) for _ in range(SIZES_COUNT)]  # noqa: S311
+    sizes_array = array.array("q", sizes)
+    rows = [
+        (
+            "[sizeof_fmt(x) for x in sizes]",
+            measure(lambda: [sizeof_fmt(x) for x in sizes], number=3),
+        ),
+        ("sizeof_fmt_many(list)", measure(lambda: sizeof_fmt_many(sizes), number=3)),
+        ("sizeof_fmt_many(array.array)", measure(lambda: sizeof_fmt_many(sizes_array), number=3)),
+    ]
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError:
+        print("\nNumPy is not installed: skip it.")  # noqa: T201
+    else:
+        sizes_numpy = np.array(sizes, dtype=np.int64)
+        rows.append(
+            ("sizeof_fmt_many(numpy)", measure(lambda: sizeof_fmt_many(sizes_numpy), number=3)),
+        )
+    print_table(f"format {SIZES_COUNT} sizes", rows)
+    strings = sizeof_fmt_many(sizes)
+    print_table(
+        f"parse {SIZES_COUNT} sizes",
+        [
+            (
+                "[parse_size(x) for x in strings]",
+                measure(lambda: [parse_size(x) for x in strings], number=3),
+            ),
+            ("sum(parse_sizes(strings))", measure(lambda: sum(parse_sizes(strings)), number=3)),
+        ],
+    )
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    rng = random.Random(0)  # noqa: S311
+    sizes = [rng.randint(0, 1024**5) for _ in range(size)]
+    sizes_array = array.array("q", sizes)
+    strings = sizeof_fmt_many(sizes)
+    yield "sizeof_fmt", lambda: list(map(sizeof_fmt, sizes))
+    yield "sizeof_fmt_many(list)", lambda: sizeof_fmt_many(sizes)
+    yield "sizeof_fmt_many(array.array)", lambda: sizeof_fmt_many(sizes_array)
+    yield "parse_size", lambda: list(map(parse_size, strings))
+    yield "parse_sizes", lambda: sum(parse_sizes(strings))
+
+
+if __name__ == "__main__":
+    main()
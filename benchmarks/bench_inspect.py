@@ -0,0 +1,96 @@
+"""Benchmark ``dev_utils.common.inspect`` functions.
+
+Run with ``python -m benchmarks.bench_inspect``.
+"""
+
+import importlib
+import inspect
+from collections.abc import Iterator
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.common.inspect import (
+    get_object_class_absolute_name,
+    get_objects_class_absolute_names,
+    resolve_absolute_name,
+)
+
+
+def _legacy_get_object_class_absolute_name(obj: object) -> str:
+    class_ = obj if inspect.isclass(obj) else obj.__class__
+    module = class_.__module__
+    if module == "builtins":
+        return class_.__qualname__
+    return module + "." + class_.__qualname__
+
+
+def _naive_resolve_absolute_name(name: str) -> object:
+    module_name, _, qualname = name.rpartition(".")
+    return getattr(importlib.import_module(module_name), qualname)
+
+
+class Event:
+    """Some user-defined class."""
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    instance = Event()
+    rows = []
+    for title, obj in (("instance", instance), ("class", Event), ("builtin", 1)):
+        rows.append(
+            (
+                f"legacy ({title})",
+                measure(lambda obj=obj: _legacy_get_object_class_absolute_name(obj)),
+            ),
+        )
+        rows.append(
+            (f"cached ({title})", measure(lambda obj=obj: get_object_class_absolute_name(obj))),
+        )
+    print_table("get_object_class_absolute_name", rows)
+    objects = [Event(), Event, 1, "a", 1.5, None, ValueError()] * 10_000
+    print_table(
+        f"{len(objects)} mixed objects",
+        [
+            (
+                "legacy list comprehension",
+                measure(
+                    lambda: [_legacy_get_object_class_absolute_name(x) for x in objects],
+                    number=10,
+                ),
+            ),
+            (
+                "cached list comprehension",
+                measure(lambda: [get_object_class_absolute_name(x) for x in objects], number=10),
+            ),
+            (
+                "get_objects_class_absolute_names",
+                measure(lambda: get_objects_class_absolute_names(objects), number=10),
+            ),
+        ],
+    )
+
+    name = "json.decoder.JSONDecoder"
+    print_table(
+        f"resolve {name!r}",
+        [
+            ("import_module + getattr", measure(lambda: _naive_resolve_absolute_name(name))),
+            ("resolve_absolute_name", measure(lambda: resolve_absolute_name(name))),
+        ],
+    )
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    objects = ([Event(), Event, 1, "a", 1.5, None, ValueError()] * (size // 7 + 1))[:size]
+    names = (["json.decoder.JSONDecoder", "int", "collections.OrderedDict"] * (size // 3 + 1))[
+        :size
+    ]
+    yield "get_object_class_absolute_name", lambda: list(
+        map(get_object_class_absolute_name, objects),
+    )
+    yield "get_objects_class_absolute_names", lambda: get_objects_class_absolute_names(objects)
+    yield "resolve_absolute_name", lambda: list(map(resolve_absolute_name, names))
+
+
+if __name__ == "__main__":
+    main()
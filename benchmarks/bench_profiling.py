@@ -0,0 +1,98 @@
+"""Benchmark ``dev_utils.profiling`` overhead.
+
+Run with ``python -m benchmarks.bench_profiling``.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from benchmarks.utils import Case, measure, measure_memory, print_table
+from dev_utils.profiling import Histogram, Profiler
+
+
+def _work(value: int) -> int:
+    return value + 1
+
+
+class _ListRecorder:
+    """Naive recorder, that keeps all durations in list."""
+
+    def __init__(self) -> None:
+        self.durations: list[int] = []
+
+    def profile(self, func: Callable[[int], int]) -> Callable[[int], int]:
+        durations = self.durations
+
+        def wrapper(value: int) -> int:
+            start = time.perf_counter_ns()
+            try:
+                return func(value)
+            finally:
+                durations.append(time.perf_counter_ns() - start)
+
+        return wrapper
+
+
+def _block(profiler: Profiler) -> int:
+    with profiler.block("block"):
+        return _work(1)
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    enabled, disabled = Profiler(enabled=True), Profiler(enabled=False)
+    enabled_work, disabled_work = enabled.profile(_work), disabled.profile(_work)
+    values = list(range(size))
+    yield "profile (off)", lambda: list(map(disabled_work, values))
+    yield "profile (on)", lambda: list(map(enabled_work, values))
+    yield "block (off)", lambda: [_block(disabled) for _ in values]
+    yield "block (on)", lambda: [_block(enabled) for _ in values]
+    histogram = Histogram()
+    yield "Histogram.record", lambda: list(map(histogram.record, values))
+    yield "report", enabled.report
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    enabled, disabled = Profiler(enabled=True), Profiler(enabled=False)
+    recorder = _ListRecorder()
+    enabled_work, disabled_work = enabled.profile(_work), disabled.profile(_work)
+    list_work = recorder.profile(_work)
+    print_table(
+        "instrumented call",
+        [
+            ("bare call", measure(lambda: _work(1))),
+            ("profile (off)", measure(lambda: disabled_work(1))),
+            ("profile (on)", measure(lambda: enabled_work(1))),
+            ("durations list", measure(lambda: list_work(1))),
+            ("block (off)", measure(lambda: _block(disabled))),
+            ("block (on)", measure(lambda: _block(enabled))),
+        ],
+    )
+    calls = 1_000_000
+
+    def _record(factory: Callable[[], Any], record: Callable[[Any], None]) -> Any:  # noqa: ANN401
+        target = factory()
+        for value in range(calls):
+            record(target)(value)
+        return target
+
+    print_table(
+        f"memory of {calls} recorded durations",
+        [
+            (
+                "Histogram",
+                measure_memory(lambda: _record(Histogram, lambda target: target.record), count=1),
+            ),
+            (
+                "list",
+                measure_memory(lambda: _record(list, lambda target: target.append), count=1),
+            ),
+        ],
+        unit="bytes",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Benchmark ``dev_utils.results`` against previous implementation and bare try/except.
+
+Run with ``python -m benchmarks.bench_results``.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+from benchmarks.utils import Case, measure, measure_memory, print_table
+from dev_utils.results import OK_NONE, Err, Ok, catch, collect, gather_results, partition
+
+
+class LegacyOk:
+    """Previous (dict-based) ``Ok`` implementation, kept for comparison."""
+
+    __match_args__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:  # noqa: ANN401
+        self._value = value
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        if isinstance(other, LegacyOk) and type(self) is type(other):
+            return self._value == other._value
+        return False
+
+    def unwrap(self) -> Any:  # noqa: ANN401, D102
+        return self._value
+
+
+class LegacyErr:
+    """Previous (dict-based) ``Err`` implementation, kept for comparison."""
+
+    __match_args__ = ("_err",)
+
+    def __init__(self, err: Exception) -> None:
+        self._err = err
+
+    def unwrap(self) -> Any:  # noqa: ANN401, D102
+        raise self._err
+
+
+ERROR = ValueError("benchmark")
+
+
+def _match_ok(result: Any) -> Any:  # noqa: ANN401
+    match result:
+        case Ok(value):
+            return value
+        case Err(err):
+            return err
+    return None  # pragma: no cover
+
+
+def _match_legacy(result: Any) -> Any:  # noqa: ANN401
+    match result:
+        case LegacyOk(value):
+            return value
+        case LegacyErr(err):
+            return err
+    return None  # pragma: no cover
+
+
+def _try_except(value: int) -> Any:  # noqa: ANN401
+    try:
+        if value < 0:
+            raise ERROR
+    except ValueError as exc:
+        return exc
+    return value
+
+
+def _two_pass_partition(results: list[Any]) -> tuple[list[Any], list[Any]]:
+    oks = [result.unwrap() for result in results if isinstance(result, Ok)]
+    errs = [result.err() for result in results if isinstance(result, Err)]
+    return oks, errs
+
+
+def _parse(value: str) -> int:
+    return int(value)
+
+
+_caught_parse = catch(ValueError)(_parse)
+
+
+def _manual_parse(value: str) -> Any:  # noqa: ANN401
+    try:
+        return Ok(int(value))
+    except ValueError as exc:
+        return Err(exc)
+
+
+def _failing_job(size: int) -> None:
+    payload = list(range(size))  # noqa: F841 - kept alive by traceback frame.
+    raise ValueError(size)
+
+
+def _err_from_job(*, lightweight: bool, keep_stack: bool = False) -> Any:  # noqa: ANN401
+    try:
+        _failing_job(100)
+    except ValueError as exc:
+        if lightweight:
+            return Err.lightweight(exc, keep_stack=keep_stack)
+        return Err(exc)
+    return None  # pragma: no cover
+
+
+async def _noop(value: int) -> int:
+    await asyncio.sleep(0)
+    if value % 10 == 0:
+        raise ERROR
+    return value
+
+
+async def _semaphore_gather(count: int, limit: int) -> list[Any]:
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _limited(value: int) -> int:
+        async with semaphore:
+            return await _noop(value)
+
+    raw = await asyncio.gather(*(_limited(i) for i in range(count)), return_exceptions=True)
+    return [Err(item) if isinstance(item, BaseException) else Ok(item) for item in raw]
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    mixed = [Ok(i) if i % 10 else Err(ERROR) for i in range(10_000)]
+    only_oks = [Ok(i) for i in range(10_000)]
+    ok, legacy_ok = Ok(42), LegacyOk(42)
+    err = Err(ERROR)
+    print_table(
+        "construction",
+        [
+            ("Ok(42)", measure(lambda: Ok(42))),
+            ("LegacyOk(42)", measure(lambda: LegacyOk(42))),
+            ("OK_NONE (shared)", measure(lambda: OK_NONE)),
+            ("LegacyOk(None)", measure(lambda: LegacyOk(None))),
+            ("Err(exc)", measure(lambda: Err(ERROR))),
+            ("LegacyErr(exc)", measure(lambda: LegacyErr(ERROR))),
+        ],
+    )
+    print_table(
+        "unwrap / eq",
+        [
+            ("Ok.unwrap()", measure(ok.unwrap)),
+            ("LegacyOk.unwrap()", measure(legacy_ok.unwrap)),
+            ("Ok == Ok", measure(lambda: ok == Ok(42))),
+            ("LegacyOk == LegacyOk", measure(lambda: legacy_ok == LegacyOk(42))),
+        ],
+    )
+    print_table(
+        "match dispatch",
+        [
+            ("match Ok", measure(lambda: _match_ok(ok))),
+            ("match Err", measure(lambda: _match_ok(err))),
+            ("match LegacyOk", measure(lambda: _match_legacy(legacy_ok))),
+            ("bare try/except (no raise)", measure(lambda: _try_except(1))),
+            ("bare try/except (raise)", measure(lambda: _try_except(-1))),
+        ],
+    )
+    print_table(
+        "@catch vs manual try/except",
+        [
+            ("@catch (ok)", measure(lambda: _caught_parse("1"))),
+            ("manual try/except (ok)", measure(lambda: _manual_parse("1"))),
+            ("@catch (err)", measure(lambda: _caught_parse("a"))),
+            ("manual try/except (err)", measure(lambda: _manual_parse("a"))),
+        ],
+    )
+    print_table(
+        "10k results combinators",
+        [
+            ("partition", measure(lambda: partition(mixed), number=200)),
+            (
+                "two-pass list comprehensions",
+                measure(lambda: _two_pass_partition(mixed), number=200),
+            ),
+            ("collect", measure(lambda: collect(only_oks), number=200)),
+            (
+                "list comprehension unwrap",
+                measure(lambda: [r.unwrap() for r in only_oks], number=200),
+            ),
+        ],
+    )
+    print_table(
+        "1k coroutines, limit=50",
+        [
+            (
+                "gather_results",
+                measure(
+                    lambda: asyncio.run(gather_results((_noop(i) for i in range(1000)), limit=50)),
+                    number=20,
+                ),
+            ),
+            (
+                "semaphore + gather(return_exceptions)",
+                measure(lambda: asyncio.run(_semaphore_gather(1000, 50)), number=20),
+            ),
+        ],
+    )
+    print_table(
+        "memory per instance",
+        [
+            ("Ok", measure_memory(lambda: Ok(42))),
+            ("LegacyOk", measure_memory(lambda: LegacyOk(42))),
+            ("Err", measure_memory(lambda: Err(ERROR))),
+            ("LegacyErr", measure_memory(lambda: LegacyErr(ERROR))),
+        ],
+        unit="bytes",
+    )
+    print_table(
+        "memory per collected Err (error raised in frame with 100-items list local)",
+        [
+            ("Err", measure_memory(lambda: _err_from_job(lightweight=False), count=10_000)),
+            (
+                "Err.lightweight",
+                measure_memory(lambda: _err_from_job(lightweight=True), count=10_000),
+            ),
+            (
+                "Err.lightweight(keep_stack=True)",
+                measure_memory(
+                    lambda: _err_from_job(lightweight=True, keep_stack=True),
+                    count=10_000,
+                ),
+            ),
+        ],
+        unit="bytes",
+    )
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each."""
+    mixed = [Ok(i) if i % 10 else Err(ERROR) for i in range(size)]
+    only_oks = [Ok(i) for i in range(size)]
+    strings = [str(i) if i % 10 else "a" for i in range(size)]
+    yield "Ok", lambda: list(map(Ok, range(size)))
+    yield "match", lambda: list(map(_match_ok, mixed))
+    yield "catch", lambda: list(map(_caught_parse, strings))
+    yield "partition", lambda: partition(mixed)
+    yield "collect", lambda: collect(only_oks)
+    yield "gather_results", lambda: asyncio.run(
+        gather_results((_noop(i) for i in range(size)), limit=50),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Benchmark ``dev_utils.common.strings`` functions.
+
+Run with ``python -m benchmarks.bench_strings``.
+"""
+
+import io
+import random
+import re
+from collections.abc import Iterator
+
+from benchmarks.utils import Case, measure, print_table
+from dev_utils.common.strings import (
+    compile_template,
+    has_format_brackets,
+    iter_trim_and_plain_text,
+    trim_and_plain_text,
+    trim_and_plain_text_many,
+)
+
+
+def _legacy_trim_and_plain_text(text: str) -> str:
+    text = text.strip()
+    while "  " in text:
+        text = text.replace("  ", " ")
+    return text.replace("\n", " ").strip()
+
+
+def _legacy_has_format_brackets(value: str) -> bool:
+    stack: list[str] = []
+    mapping = {"}": "{"}
+    balanced = True
+    for char in value:
+        if char == "}":
+            top_element = stack.pop() if stack else "#"
+            if mapping[char] != top_element:
+                balanced = False
+                break
+        elif char == "{":
+            stack.append(char)
+    is_valid = not stack if balanced else balanced
+    if not is_valid:
+        return is_valid
+    pattern = (
+        r"(\{[\"\!\"\#\$\%\&\'\(\)\*\+\,\-\.\/\:\;\<\=\>\?\@\[\\\]\^\_\`\|\~]+\})|(\{\d+\w*\})"
+    )
+    if re.match(pattern, value):
+        return False
+    left_count = value.count("{")
+    right_count = value.count("}")
+    escaped_left = 0
+    escaped_right = value.count("\\}")
+    return (
+        (left_count - (escaped_left * 2) != 0)
+        and (right_count - (escaped_right * 2) != 0)
+        and (left_count == right_count)
+    )
+
+
+def _legacy_send(template: str, values: dict[str, str]) -> str:
+    if not _legacy_has_format_brackets(template):
+        return template
+    return template.format(**values)
+
+
+def _compiled_send(template: str, values: dict[str, str]) -> str:
+    return compile_template(template).render_map(values)
+
+
+def _scraped_document(size: int) -> str:
+    """Build text with long runs of spaces and newlines, like scraped HTML text has."""
+    part = "Some words of scraped paragraph." + " " * 300 + "\n" * 20 + "    next line   "
+    return (part * (size // len(part) + 1))[:size]
+
+
+def main() -> None:
+    """Run benchmarks and print results."""
+    document = _scraped_document(4 * 1024 * 1024)
+    print_table(
+        "normalize 4Mb document",
+        [
+            (
+                "legacy trim_and_plain_text",
+                measure(lambda: _legacy_trim_and_plain_text(document), number=1),
+            ),
+            ("trim_and_plain_text", measure(lambda: trim_and_plain_text(document), number=1)),
+            (
+                "iter_trim_and_plain_text(file)",
+                measure(
+                    lambda: sum(map(len, iter_trim_and_plain_text(io.StringIO(document)))),
+                    number=1,
+                ),
+            ),
+        ],
+    )
+
+    random.seed(0)
+    titles = [f"  Product   title number {i}  " for i in range(5_000)] + [
+        f"Clean title {i}" for i in range(5_000)
+    ]
+    column = random.choices(titles, k=1_000_000)  # noqa: S311
+    print_table(
+        "normalize column of 1M short strings (10k unique)",
+        [
+            (
+                "legacy, one by one",
+                measure(lambda: [_legacy_trim_and_plain_text(text) for text in column], number=1),
+            ),
+            (
+                "trim_and_plain_text, one by one",
+                measure(lambda: [trim_and_plain_text(text) for text in column], number=1),
+            ),
+            (
+                "trim_and_plain_text_many",
+                measure(lambda: trim_and_plain_text_many(column), number=1),
+            ),
+        ],
+    )
+
+    template = (
+        "Hello, {user}! Your order {order_id} from {shop} is on the way. It will be delivered "
+        "to {address} at {time}. Track it on our site or reply to this message."
+    )
+    values = {
+        "user": "John",
+        "order_id": "42",
+        "shop": "Shop",
+        "address": "Some street, 1",
+        "time": "12:00",
+    }
+    print_table(
+        "notification template",
+        [
+            ("legacy has_format_brackets", measure(lambda: _legacy_has_format_brackets(template))),
+            ("has_format_brackets", measure(lambda: has_format_brackets(template))),
+            ("legacy validate + format", measure(lambda: _legacy_send(template, values))),
+            ("compile_template + render_map", measure(lambda: _compiled_send(template, values))),
+        ],
+    )
+
+
+def suite(size: int) -> Iterator[Case]:
+    """Yield regression suite cases, that process ``size`` items each.
+
+    Items of documents are 100-characters chunks.
+    """
+    rng = random.Random(0)  # noqa: S311
+    titles = [f"  Product   title number {i}  " for i in range(size // 2 + 1)]
+    titles += [f"Clean title {i}" for i in range(size // 2 + 1)]
+    column = rng.choices(titles, k=size)
+    document = _scraped_document(size * 100)
+    template = "Hello, {user}! Your order {order_id} is on the way."
+    values = {"user": "John", "order_id": "42"}
+    yield "trim_and_plain_text", lambda: list(map(trim_and_plain_text, column))
+    yield "trim_and_plain_text_many", lambda: trim_and_plain_text_many(column)
+    yield "trim_and_plain_text(document)", lambda: trim_and_plain_text(document)
+    yield "iter_trim_and_plain_text(file)", lambda: sum(
+        map(len, iter_trim_and_plain_text(io.StringIO(document))),
+    )
+    yield "has_format_brackets", lambda: [has_format_brackets(template) for _ in range(size)]
+    yield "compile_template.render_map", lambda: [
+        compile_template(template).render_map(values) for _ in range(size)
+    ]
+
+
+if __name__ == "__main__":
+    main()
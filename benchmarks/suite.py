@@ -0,0 +1,182 @@
+"""Benchmark suite with machine-readable output and regression gate.
+
+Each ``bench_*`` module defines ``suite(size)`` generator, that yields named cases. Each case
+processes ``size`` items, and sizes are taken from ``SIZES``. Run all suites and save results::
+
+    python -m benchmarks.suite run --output results.json
+
+Compare results with stored baseline and fail, if any case became slower by more than
+``threshold`` percents::
+
+    python -m benchmarks.suite compare benchmarks/baseline.json results.json --threshold 25
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from benchmarks.utils import SIZES, Suite, measure_auto
+
+MODULES = (
+    "results",
+    "guards",
+    "abstract",
+    "envs",
+    "humanize",
+    "strings",
+    "inspect",
+    "datetime",
+    "profiling",
+)
+
+Results = dict[str, dict[str, dict[str, float]]]
+
+
+def _run_module(module: str, sizes: Sequence[str]) -> dict[str, dict[str, float]]:
+    suite: Suite = importlib.import_module(f"benchmarks.bench_{module}").suite
+    results: dict[str, dict[str, float]] = {}
+    for size in sizes:
+        for case, func in suite(SIZES[size]):
+            results.setdefault(case, {})[size] = round(measure_auto(func), 1)
+    return results
+
+
+def _run_module_in_subprocess(module: str, sizes: Sequence[str]) -> dict[str, dict[str, float]]:
+    command = [sys.executable, "-m", "benchmarks.suite", "run", "--processes", "0"]
+    command += ["--module", module]
+    for size in sizes:
+        command += ["--size", size]
+    completed = subprocess.run(command, check=True, capture_output=True, text=True)  # noqa: S603
+    return json.loads(completed.stdout)["results"][module]
+
+
+def run(
+    modules: Sequence[str] = MODULES,
+    sizes: Sequence[str] = tuple(SIZES),
+    *,
+    processes: int = 3,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Run suites of given modules with given sizes.
+
+    Modules are measured in ``processes`` rounds, each module in new interpreter in each round,
+    and the best result of each case is kept. It isolates modules from each other, and spreads
+    measurements of each case in time, so short bursts of load on machine do not affect them.
+    If ``processes`` is 0, modules are measured once in current process.
+
+    Results are nested as ``{module: {case: {size: nanoseconds per call}}}``.
+    """
+    results: Results = {}
+    if processes == 0:
+        results = {module: _run_module(module, sizes) for module in modules}
+    for _ in range(processes):
+        for module in modules:
+            for case, values in _run_module_in_subprocess(module, sizes).items():
+                best = results.setdefault(module, {}).setdefault(case, {})
+                for size, value in values.items():
+                    best[size] = min(value, best.get(size, value))
+    if verbose:
+        for module, cases in results.items():
+            for case, values in cases.items():
+                for size, value in values.items():
+                    line = f"{module:<10} {size:<7} {case:<45} {value / 1e3:>12.1f} us"
+                    print(line)  # noqa: T201
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "sizes": {size: SIZES[size] for size in sizes},
+        },
+        "results": results,
+    }
+
+
+def _flatten(results: Results) -> dict[str, float]:
+    return {
+        f"{module}.{case}[{size}]": value
+        for module, cases in results.items()
+        for case, values in cases.items()
+        for size, value in values.items()
+    }
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float,
+) -> list[str]:
+    """Print comparison of current results with baseline and return names of regressed cases.
+
+    Case is regressed, if it became slower by more than ``threshold`` percents. Cases, that
+    exist only in one of results, are reported, but are not regressions.
+    """
+    before, after = _flatten(baseline["results"]), _flatten(current["results"])
+    width = max(map(len, before.keys() | after.keys()), default=0)
+    regressions: list[str] = []
+    for name in sorted(before.keys() | after.keys()):
+        if name not in after or name not in before:
+            status = "removed" if name not in after else "new"
+            print(f"{name:<{width}}  {status}")  # noqa: T201
+            continue
+        change = (after[name] / before[name] - 1) * 100
+        status = ""
+        if change > threshold:
+            regressions.append(name)
+            status = "  REGRESSION"
+        print(  # noqa: T201
+            f"{name:<{width}}  {before[name] / 1e3:>12.1f} us -> {after[name] / 1e3:>12.1f} us"
+            f"  {change:>+7.1f}%{status}",
+        )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run command line interface and return exit code."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run suites and save results as JSON")
+    run_parser.add_argument("--output", type=Path, help="JSON file (stdout by default)")
+    run_parser.add_argument("--module", action="append", choices=MODULES, dest="modules")
+    run_parser.add_argument("--size", action="append", choices=tuple(SIZES), dest="sizes")
+    run_parser.add_argument("--processes", type=int, default=3, help="0 to use current process")
+    compare_parser = commands.add_parser("compare", help="compare results with baseline")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=25.0, help="percents")
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        data = run(
+            args.modules or MODULES,
+            args.sizes or tuple(SIZES),
+            processes=args.processes,
+            verbose=args.output is not None,
+        )
+        output = json.dumps(data, indent=2, sort_keys=True)
+        if args.output is None:
+            print(output)  # noqa: T201
+        else:
+            args.output.write_text(output + "\n")
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = compare(baseline, current, threshold=args.threshold)
+    if regressions:
+        print(  # noqa: T201
+            f"\n{len(regressions)} case(s) regressed by more than {args.threshold}%.",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
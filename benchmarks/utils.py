@@ -0,0 +1,62 @@
+"""Shared helpers for benchmark modules."""
+
+import gc
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+Case = tuple[str, Callable[[], Any]]
+Suite = Callable[[int], Iterator[Case]]
+
+# NOTE: number of processed items (values, lines, classes, etc.) in one call of suite case.
+SIZES = {"small": 10, "medium": 1_000, "huge": 100_000}
+
+
+def measure(func: Callable[[], Any], *, number: int = 100_000, repeat: int = 5) -> float:
+    """Measure best-of-``repeat`` time of one ``func`` call in nanoseconds."""
+    timer = timeit.Timer(func)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def measure_auto(func: Callable[[], Any], *, repeat: int = 5, min_time: float = 0.1) -> float:
+    """Measure best-of-``repeat`` time of one ``func`` call in nanoseconds.
+
+    Number of calls in each repeat is chosen, so one repeat takes at least ``min_time`` seconds.
+    It keeps measurements of fast and slow calls equally stable and bounded in time.
+    """
+    # NOTE: garbage of previous measurements (like thousands of created classes) slows down
+    # allocations, and ``timeit`` disables garbage collection while measuring.
+    gc.collect()
+    timer = timeit.Timer(func)
+    first = timer.timeit(number=1)
+    number = max(1, int(min_time / first)) if first > 0 else 1_000_000
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def measure_memory(factory: Callable[[], Any], *, count: int = 100_000) -> float:
+    """Measure average memory in bytes, that one object, returned by ``factory``, takes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [factory() for _ in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # NOTE: list of references itself is not a part of the object size.
+    list_overhead = objects.__sizeof__()
+    del objects
+    return (after - before - list_overhead) / count
+
+
+def print_table(title: str, rows: Iterable[tuple[str, float]], *, unit: str = "ns") -> None:
+    """Print benchmark results as simple aligned table."""
+    rows = list(rows)
+    width = max((len(name) for name, _ in rows), default=0)
+    print(f"\n{title}")  # noqa: T201
+    print("-" * (width + 20))  # noqa: T201
+    for name, value in rows:
+        print(f"{name:<{width}}  {value:>12.1f} {unit}")  # noqa: T201
@@ -1,10 +1,14 @@
+from collections import deque
 from typing import Any, Generic, Never, TypeVar, cast
 from warnings import warn
 
-from dev_utils.common import get_object_class_absolute_name
+from dev_utils.common import get_object_class_absolute_name, getenv_bool
 
 T = TypeVar("T")
 
+DEFERRED_VALIDATION_ENV = "DEV_UTILS_DEFERRED_ABSTRACT_VALIDATION"
+_pending_classes: "deque[tuple[type[Abstract], bool]]" = deque()
+
 
 class AbstractClassWithoutAbstractPropertiesWarning(Warning):
     """Warning about situation, when class inherited by Abstract, but has no abstract props."""
@@ -114,35 +118,117 @@ def abstract_class_property(propertytype: type[T]) -> T:
 
 
 class Abstract:
-    """Abstract class for to use with abstract_class_property."""
+    """Abstract class for to use with abstract_class_property.
+
+    Names of abstract class properties, that are not defined yet, are kept in
+    ``__abstract_class_properties__`` of each subclass. Registry is built from registries of
+    bases and subclass own ``__dict__``, so subclass check does not depend on number of
+    attributes in its MRO.
+
+    If ``DEV_UTILS_DEFERRED_ABSTRACT_VALIDATION`` environment variable is true, subclass creation
+    only records it. Registries are built and subclasses are checked in one batch on first
+    instantiation of any ``Abstract`` subclass or on ``validate_abstract_classes`` call with the
+    same errors and warnings.
+    """
 
     __skip_abstract_raise_error__: bool = False
+    __abstract_class_properties__: frozenset[str] = frozenset()
 
     def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401, D105
         super().__init_subclass__(**kwargs)
-        if cls.__skip_abstract_raise_error__:
+        skip = cls.__skip_abstract_raise_error__
+        if skip:
             # NOTE: for further inherit.
             cls.__skip_abstract_raise_error__ = False
+        # NOTE: class, which base is still deferred, is deferred too, even if deferred mode was
+        # switched off, because registry of its base is not built yet.
+        if getenv_bool(DEFERRED_VALIDATION_ENV) or _has_pending_base(cls):
+            _defer_validation(cls, check=not skip)
             return
-        if Abstract in cls.__bases__:
-            for name in dir(cls):
-                if name.startswith("__") and name.endswith("__"):
-                    continue
-                if isinstance(getattr(cls, name), _AbstractClassProperty):
-                    break
-            else:
-                msg = (
-                    f"Class {cls.__name__} is defined as abstract but does not "
-                    "have any abstract class properties defined."
-                )
-                warn(AbstractClassWithoutAbstractPropertiesWarning(msg), stacklevel=2)
-        else:
-            for name in dir(cls):
-                if name.startswith("__") and name.endswith("__"):
-                    continue
-                if isinstance(getattr(cls, name), _AbstractClassProperty):  # pragma: no coverage
-                    msg = (
-                        f"Class {cls.__name__} must define abstract class "
-                        f"property {name}, or have Abstract as direct parent."
-                    )
-                    raise TypeError(msg)
+        cls.__abstract_class_properties__ = _collect_abstract_class_properties(cls)
+        if not skip:
+            _validate_abstract_class(cls, stacklevel=3)
+
+
+def _validate_abstract_class(cls: type[Abstract], *, stacklevel: int) -> None:
+    if Abstract in cls.__bases__:
+        if not cls.__abstract_class_properties__:
+            msg = (
+                f"Class {cls.__name__} is defined as abstract but does not "
+                "have any abstract class properties defined."
+            )
+            warn(AbstractClassWithoutAbstractPropertiesWarning(msg), stacklevel=stacklevel)
+    elif cls.__abstract_class_properties__:
+        # NOTE: sorted to report the same property, as ``dir`` order gives.
+        name = min(cls.__abstract_class_properties__)
+        msg = (
+            f"Class {cls.__name__} must define abstract class "
+            f"property {name}, or have Abstract as direct parent."
+        )
+        raise TypeError(msg)
+
+
+def _new_with_validation(cls: type[Any], *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    if _pending_classes:
+        validate_abstract_classes()
+    new = super(Abstract, cls).__new__
+    if new is not object.__new__:
+        return new(cls, *args, **kwargs)
+    # NOTE: ``object.__new__`` rejects arguments of overridden ``__new__`` with another message,
+    # so classes without own ``__init__`` are checked here, as it is done without hook.
+    if (args or kwargs) and cls.__init__ is object.__init__:
+        msg = f"{cls.__name__}() takes no arguments"
+        raise TypeError(msg)
+    return new(cls)
+
+
+def _has_pending_base(cls: type[Abstract]) -> bool:
+    if not _pending_classes:
+        return False
+    pending = {pending_cls for pending_cls, _ in _pending_classes}
+    return any(base in pending for base in cls.__mro__[1:])
+
+
+def _defer_validation(cls: type[Abstract], *, check: bool) -> None:
+    _pending_classes.append((cls, check))
+    # NOTE: hook is installed only in deferred mode, so eager mode instantiation is not slowed
+    # down. It is never removed: deleting ``__new__`` from class breaks its subclasses creation.
+    if "__new__" not in Abstract.__dict__:
+        Abstract.__new__ = staticmethod(_new_with_validation)  # type: ignore reportAttributeAccessIssue
+
+
+def validate_abstract_classes() -> None:
+    """Validate all ``Abstract`` subclasses, which checks were deferred.
+
+    Use it on application startup, if deferred mode is enabled with
+    ``DEV_UTILS_DEFERRED_ABSTRACT_VALIDATION`` environment variable. Classes are validated in
+    creation order. If some class is not valid, error is raised and remaining classes stay
+    deferred until the next call.
+
+    Raises
+    ------
+    TypeError
+        if some deferred class does not define inherited abstract class properties.
+    """
+    while _pending_classes:
+        # NOTE: classes are processed in creation order, so registries of bases are ready.
+        cls, check = _pending_classes.popleft()
+        cls.__abstract_class_properties__ = _collect_abstract_class_properties(cls)
+        if check:
+            _validate_abstract_class(cls, stacklevel=3)
+
+
+def _collect_abstract_class_properties(cls: type[Any]) -> frozenset[str]:
+    """Get names of abstract class properties, which are not overridden in given class."""
+    candidates = {
+        name
+        for name, value in cls.__dict__.items()
+        if isinstance(value, _AbstractClassProperty)
+        and not (name.startswith("__") and name.endswith("__"))
+    }
+    for base in cls.__bases__:
+        candidates.update(getattr(base, "__abstract_class_properties__", ()))
+    # NOTE: inherited property may be overridden by class itself or by other base in MRO.
+    return frozenset(
+        name for name in candidates if isinstance(getattr(cls, name), _AbstractClassProperty)
+    )
@@ -1,10 +1,91 @@
-"""Core utils."""
-
-from .datetime import get_utc_now as get_utc_now
-from .envs import getenv_bool as getenv_bool
-from .envs import getenv_int as getenv_int
-from .envs import getenv_list as getenv_list
-from .humanize import sizeof_fmt as sizeof_fmt
-from .inspect import get_object_class_absolute_name as get_object_class_absolute_name
-from .strings import has_format_brackets as has_format_brackets
-from .strings import trim_and_plain_text as trim_and_plain_text
+"""Core utils.
+
+Names are re-exported lazily: submodule is imported on the first access to any of its names, so
+``import dev_utils.common`` (and modules, that use only some of its utils) does not pay import
+time of all submodules and their dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .datetime import CoarseUTCClock as CoarseUTCClock
+    from .datetime import FrozenUTCClock as FrozenUTCClock
+    from .datetime import UTCClock as UTCClock
+    from .datetime import UTCISOCodec as UTCISOCodec
+    from .datetime import get_coarse_utc_now as get_coarse_utc_now
+    from .datetime import get_utc_now as get_utc_now
+    from .datetime import use_utc_clock as use_utc_clock
+    from .envs import EnvConfigError as EnvConfigError
+    from .envs import EnvConfigLoader as EnvConfigLoader
+    from .envs import EnvField as EnvField
+    from .envs import EnvSnapshot as EnvSnapshot
+    from .envs import getenv_bool as getenv_bool
+    from .envs import getenv_int as getenv_int
+    from .envs import getenv_list as getenv_list
+    from .envs import load_dotenv as load_dotenv
+    from .envs import parse_dotenv as parse_dotenv
+    from .humanize import parse_size as parse_size
+    from .humanize import parse_sizes as parse_sizes
+    from .humanize import sizeof_fmt as sizeof_fmt
+    from .humanize import sizeof_fmt_many as sizeof_fmt_many
+    from .inspect import get_object_class_absolute_name as get_object_class_absolute_name
+    from .inspect import get_objects_class_absolute_names as get_objects_class_absolute_names
+    from .inspect import resolve_absolute_name as resolve_absolute_name
+    from .strings import CompiledTemplate as CompiledTemplate
+    from .strings import PlainTextNormalizer as PlainTextNormalizer
+    from .strings import compile_template as compile_template
+    from .strings import has_format_brackets as has_format_brackets
+    from .strings import iter_trim_and_plain_text as iter_trim_and_plain_text
+    from .strings import trim_and_plain_text as trim_and_plain_text
+    from .strings import trim_and_plain_text_many as trim_and_plain_text_many
+
+_LAZY_IMPORTS = {
+    "CoarseUTCClock": "datetime",
+    "FrozenUTCClock": "datetime",
+    "UTCClock": "datetime",
+    "UTCISOCodec": "datetime",
+    "get_coarse_utc_now": "datetime",
+    "get_utc_now": "datetime",
+    "use_utc_clock": "datetime",
+    "EnvConfigError": "envs",
+    "EnvConfigLoader": "envs",
+    "EnvField": "envs",
+    "EnvSnapshot": "envs",
+    "getenv_bool": "envs",
+    "getenv_int": "envs",
+    "getenv_list": "envs",
+    "load_dotenv": "envs",
+    "parse_dotenv": "envs",
+    "parse_size": "humanize",
+    "parse_sizes": "humanize",
+    "sizeof_fmt": "humanize",
+    "sizeof_fmt_many": "humanize",
+    "get_object_class_absolute_name": "inspect",
+    "get_objects_class_absolute_names": "inspect",
+    "resolve_absolute_name": "inspect",
+    "CompiledTemplate": "strings",
+    "PlainTextNormalizer": "strings",
+    "compile_template": "strings",
+    "has_format_brackets": "strings",
+    "iter_trim_and_plain_text": "strings",
+    "trim_and_plain_text": "strings",
+    "trim_and_plain_text_many": "strings",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    # NOTE: next accesses to this name will not call ``__getattr__`` at all.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
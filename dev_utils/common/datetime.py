@@ -1,6 +1,14 @@
 """Module with datetime core utils."""
 
+import contextlib
 import datetime
+import time
+from itertools import repeat
+from operator import attrgetter, floordiv, sub
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
 
 
 def get_utc_now() -> datetime.datetime:
@@ -11,3 +19,286 @@ def get_utc_now() -> datetime.datetime:
         datetime: current datetime with UTC timezone.
     """
     return datetime.datetime.now(datetime.UTC)
+
+
+class UTCClock(Protocol):
+    """Clock, that returns current UTC datetime."""
+
+    def now(self) -> datetime.datetime:
+        """Get current UTC datetime."""
+        ...
+
+
+class CoarseUTCClock:
+    """UTC clock, that reuses the same datetime object within given resolution (in seconds).
+
+    Datetime is computed from monotonic time offset to wall time, taken on clock creation, for
+    the start of current resolution tick and is cached until the tick ends. So most calls cost
+    one monotonic clock read and one comparison, and returned value is behind real time by less
+    than resolution. Offset is taken again every
+    ``resync_interval`` seconds to follow wall clock adjustments.
+
+    Cached value is one immutable tuple, which is replaced atomically, so clock can be shared
+    between threads without locks. Time sources can be injected for tests.
+    """
+
+    __slots__ = ("_base", "_monotonic", "_resync_interval", "_state", "_time", "resolution")
+
+    def __init__(
+        self,
+        resolution: float = 0.001,
+        *,
+        resync_interval: float = 60.0,
+        monotonic: "Callable[[], float]" = time.monotonic,
+        time_: "Callable[[], float]" = time.time,
+    ) -> None:
+        if resolution <= 0:
+            msg = f"Resolution should be positive, got {resolution}."
+            raise ValueError(msg)
+        self.resolution = resolution
+        self._resync_interval = resync_interval
+        self._monotonic = monotonic
+        self._time = time_
+        # NOTE: state is kept in tuples, which are replaced atomically: (monotonic time, wall
+        # time) pair for offset and (monotonic expiration time, cached datetime) pair.
+        self._base: tuple[float, float] = (self._monotonic(), self._time())
+        self._state: tuple[float, datetime.datetime | None] = (float("-inf"), None)
+
+    def resync(self) -> None:
+        """Take offset between monotonic and wall time again and drop cached datetime."""
+        self._base = (self._monotonic(), self._time())
+        self._state = (float("-inf"), None)
+
+    def now(self) -> datetime.datetime:
+        """Get current UTC datetime with clock resolution."""
+        monotonic = self._monotonic()
+        expires_at, value = self._state
+        if monotonic < expires_at:
+            return value  # type: ignore reportReturnType
+        base_monotonic, base_wall = self._base
+        if monotonic - base_monotonic >= self._resync_interval:
+            self.resync()
+            base_monotonic, base_wall = self._base
+        # NOTE: datetime is computed for the tick start, so threads, that compute it at the same
+        # time, get equal values and clock never goes back because of concurrent updates.
+        tick_start = monotonic - monotonic % self.resolution
+        value = datetime.datetime.fromtimestamp(
+            base_wall + (tick_start - base_monotonic),
+            datetime.UTC,
+        )
+        self._state = (tick_start + self.resolution, value)
+        return value
+
+
+class FrozenUTCClock:
+    """UTC clock for tests, which returns given datetime until it is changed.
+
+    Usage
+    -----
+
+    ```
+        clock = FrozenUTCClock(datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC))
+        with use_utc_clock(clock):
+            assert get_coarse_utc_now() == datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+            clock.advance(datetime.timedelta(seconds=1))
+    ```
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: datetime.datetime | None = None) -> None:
+        self._value = get_utc_now() if value is None else value
+
+    def now(self) -> datetime.datetime:
+        """Get frozen datetime."""
+        return self._value
+
+    def set(self, value: datetime.datetime) -> None:
+        """Freeze clock on given datetime."""
+        self._value = value
+
+    def advance(self, delta: datetime.timedelta) -> None:
+        """Move frozen datetime by given delta."""
+        self._value += delta
+
+
+_clock: UTCClock = CoarseUTCClock()
+
+
+def get_coarse_utc_now() -> datetime.datetime:
+    """Get current UTC datetime from coarse clock.
+
+    By default, clock has 1 ms resolution: all calls within one millisecond return the same
+    datetime object. Use ``use_utc_clock`` to replace clock (for example, in tests).
+    """
+    return _clock.now()
+
+
+@contextlib.contextmanager
+def use_utc_clock(clock: UTCClock) -> "Iterator[UTCClock]":
+    """Replace clock of ``get_coarse_utc_now`` inside context."""
+    global _clock  # noqa: PLW0603
+    previous, _clock = _clock, clock
+    try:
+        yield clock
+    finally:
+        _clock = previous
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)  # noqa: DTZ001
+_UTC_EPOCH = _EPOCH.replace(tzinfo=datetime.UTC)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_UTC_SUFFIX = "+00:00"
+_TZINFO = attrgetter("tzinfo")
+
+
+class UTCISOCodec:
+    """Formatter and parser of ISO-8601 UTC timestamps for bulk data (like logs).
+
+    Consecutive timestamps usually share the same date and time up to seconds, so rendered
+    ``YYYY-MM-DDTHH:MM:SS`` prefixes are cached on formatting, and only sub-second part is
+    rendered on each call. Cache is cleared, when it reaches ``cache_size`` prefixes. Output is
+    exactly the same, as ``datetime.isoformat`` returns, and non-UTC datetimes are formatted by
+    ``isoformat`` itself.
+
+    Parsing is done by ``datetime.fromisoformat``: it is implemented in C and is faster, than
+    any cached parsing in Python, so batch methods only avoid per-value Python calls.
+
+    Epoch values are integer microseconds since 1970-01-01 UTC (like NumPy ``datetime64[us]``
+    values), so they are converted without float rounding.
+    """
+
+    __slots__ = ("_cache_size", "_epoch_prefixes", "_prefixes")
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self._cache_size = cache_size
+        self._prefixes: dict[tuple[int, int, int, int, int, int], str] = {}
+        self._epoch_prefixes: dict[int, str] = {}
+
+    def cache_clear(self) -> None:
+        """Clear all cached prefixes."""
+        self._prefixes.clear()
+        self._epoch_prefixes.clear()
+
+    def format(self, value: datetime.datetime) -> str:
+        """Format datetime as ``value.isoformat()`` does."""
+        if value.tzinfo is not datetime.UTC:
+            return value.isoformat()
+        key = (value.year, value.month, value.day, value.hour, value.minute, value.second)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = self._cache_prefix(key)
+        microsecond = value.microsecond
+        if microsecond:
+            return f"{prefix}.{microsecond:06d}{_UTC_SUFFIX}"
+        return prefix + _UTC_SUFFIX
+
+    def format_many(self, values: "Iterable[datetime.datetime]") -> list[str]:
+        """Format many datetimes as ``isoformat`` does."""
+        utc, get_prefix, cache_prefix = datetime.UTC, self._prefixes.get, self._cache_prefix
+        result: list[str] = []
+        append = result.append
+        for value in values:
+            if value.tzinfo is not utc:
+                append(value.isoformat())
+                continue
+            key = (value.year, value.month, value.day, value.hour, value.minute, value.second)
+            prefix = get_prefix(key)
+            if prefix is None:
+                prefix = cache_prefix(key)
+            microsecond = value.microsecond
+            if microsecond:
+                append(f"{prefix}.{microsecond:06d}{_UTC_SUFFIX}")
+            else:
+                append(prefix + _UTC_SUFFIX)
+        return result
+
+    def format_epoch_us(self, value: int) -> str:
+        """Format epoch microseconds as ``isoformat`` of UTC datetime does."""
+        seconds, microsecond = divmod(value, 1_000_000)
+        prefix = self._epoch_prefixes.get(seconds)
+        if prefix is None:
+            prefix = self._cache_epoch_prefix(seconds)
+        if microsecond:
+            return f"{prefix}.{microsecond:06d}{_UTC_SUFFIX}"
+        return prefix + _UTC_SUFFIX
+
+    def format_epoch_us_many(self, values: "Iterable[int] | Any") -> list[str]:  # noqa: ANN401
+        """Format many epoch microseconds values.
+
+        Accepts any iterable of integers, ``array.array`` and NumPy arrays of integers or
+        datetimes (``datetime64`` values are converted to microseconds).
+        """
+        dtype = getattr(values, "dtype", None)
+        if dtype is not None and dtype.kind == "M":
+            values = values.astype("datetime64[us]").astype("int64")
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+        get_prefix, cache_prefix = self._epoch_prefixes.get, self._cache_epoch_prefix
+        result: list[str] = []
+        append = result.append
+        for value in values:
+            seconds, microsecond = divmod(value, 1_000_000)
+            prefix = get_prefix(seconds)
+            if prefix is None:
+                prefix = cache_prefix(seconds)
+            if microsecond:
+                append(f"{prefix}.{microsecond:06d}{_UTC_SUFFIX}")
+            else:
+                append(prefix + _UTC_SUFFIX)
+        return result
+
+    def parse(self, value: str) -> datetime.datetime:
+        """Parse datetime as ``datetime.fromisoformat`` does.
+
+        ``fromisoformat`` is implemented in C and is already faster, than any cached parsing
+        into new datetime objects, so it is used as is. This method exists for API symmetry.
+        """
+        return datetime.datetime.fromisoformat(value)
+
+    def parse_many(self, values: "Iterable[str]") -> list[datetime.datetime]:
+        """Parse many datetimes as ``datetime.fromisoformat`` does."""
+        return list(map(datetime.datetime.fromisoformat, values))
+
+    def parse_epoch_us(self, value: str) -> int:
+        """Parse ISO-8601 string into epoch microseconds.
+
+        Strings without timezone are treated as UTC ones.
+        """
+        return _to_epoch_us(datetime.datetime.fromisoformat(value))
+
+    def parse_epoch_us_many(self, values: "Iterable[str]") -> list[int]:
+        """Parse many ISO-8601 strings into epoch microseconds.
+
+        If all strings are in UTC (or all strings are without timezone), all values are converted
+        at once with C-level ``map`` calls.
+        """
+        parsed = list(map(datetime.datetime.fromisoformat, values))
+        tzinfos = set(map(_TZINFO, parsed))
+        if tzinfos == {datetime.UTC}:
+            epoch = _UTC_EPOCH
+        elif tzinfos == {None}:
+            epoch = _EPOCH
+        else:
+            return list(map(_to_epoch_us, parsed))
+        return list(map(floordiv, map(sub, parsed, repeat(epoch)), repeat(_MICROSECOND)))
+
+    def _cache_prefix(self, key: tuple[int, int, int, int, int, int]) -> str:
+        if len(self._prefixes) >= self._cache_size:
+            self._prefixes.clear()
+        prefix = datetime.datetime(*key).isoformat()  # noqa: DTZ001
+        self._prefixes[key] = prefix
+        return prefix
+
+    def _cache_epoch_prefix(self, seconds: int) -> str:
+        if len(self._epoch_prefixes) >= self._cache_size:
+            self._epoch_prefixes.clear()
+        prefix = (_EPOCH + datetime.timedelta(seconds=seconds)).isoformat()
+        self._epoch_prefixes[seconds] = prefix
+        return prefix
+
+
+def _to_epoch_us(value: datetime.datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.UTC).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
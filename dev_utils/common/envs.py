@@ -5,27 +5,341 @@ BaseSettings not needed, like situations, when you need to get one env var befor
 build.
 """
 
+import functools
+import mmap
 import os
+import re
+import stat
+from collections.abc import Callable, Hashable, Mapping
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from pathlib import Path
 
-def getenv_list(key: str, default: str = "", separator: str = ",") -> list[str]:
-    """Get environment variable as list of strings."""
-    value = os.getenv(key, default)
+_MISSING: Any = object()
+_NOT_CACHED: tuple[Any, Any] = (_MISSING, _MISSING)
+
+
+def _parse_list(value: str, separator: str) -> list[str]:
     if separator not in value and not value.isalnum():
         return []
     result_list = [x.strip() for x in value.strip().split(separator)]
     return list(filter(lambda x: x, result_list))
 
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes", "t")
+
+
+def _parse_int(value: str, default: int | None) -> int | None:
+    try:
+        return int(float(value))
+    except ValueError:
+        return default
+
+
+class EnvSnapshot:
+    """Environment variables snapshot with memoized typed values.
+
+    By default, ``os.environ`` is copied once on creation, so later changes of environment are
+    not visible until ``refresh`` call. Each typed value is parsed only once per key and parse
+    params, so repeated lookups (like feature flags per request) cost one dict hit.
+
+    If ``live`` is True, given environ is not copied and raw value is read on each lookup. Parsed
+    value is reused, while raw value stays the same. Live snapshot without given environ looks
+    up ``os.environ`` on each call, so its rebinding (like ``mock.patch("os.environ", ...)``)
+    is visible too.
+
+    Usage
+    -----
+
+    ```
+        env = EnvSnapshot()
+        if env.get_bool("FEATURE_ENABLED"):
+            ...
+        env.refresh()  # re-read os.environ and drop parsed values.
+    ```
+    """
+
+    __slots__ = ("_cache", "_environ", "_live")
+
+    def __init__(self, environ: Mapping[str, str] | None = None, *, live: bool = False) -> None:
+        self._live = live
+        # NOTE: None means live ``os.environ``, that is looked up on each call.
+        self._environ: Mapping[str, str] | None = {}
+        self._cache: dict[Hashable, tuple[str | None, Any]] = {}
+        self.refresh(environ)
+
+    @classmethod
+    def from_dotenv(cls, path: "str | Path", *, override: bool = False) -> "EnvSnapshot":
+        """Create snapshot of ``os.environ`` merged with values from given ``.env`` file.
+
+        Variables, that are already set in environment, are not overridden by file values unless
+        ``override`` is True. ``os.environ`` itself is not changed.
+        """
+        values = parse_dotenv(path)
+        if override:
+            return cls({**os.environ, **values})
+        return cls({**values, **os.environ})
+
+    def refresh(self, environ: Mapping[str, str] | None = None) -> None:
+        """Capture environ again and drop all memoized values.
+
+        If no environ was passed, ``os.environ`` is used.
+        """
+        if self._live:
+            self._environ = environ
+        else:
+            self._environ = dict(os.environ if environ is None else environ)
+        self._cache.clear()
+
+    def get_str(self, key: str, default: str | None = None) -> str | None:
+        """Get environment variable raw string value."""
+        environ = os.environ if self._environ is None else self._environ
+        return environ.get(key, default)
+
+    def get_list(self, key: str, default: str = "", separator: str = ",") -> list[str]:
+        """Get environment variable as list of strings."""
+        raw = (os.environ if self._environ is None else self._environ).get(key)
+        cache_key = ("list", key, default, separator)
+        cached = self._cache.get(cache_key, _NOT_CACHED)
+        if cached[0] == raw:
+            value = cached[1]
+        else:
+            value = tuple(_parse_list(default if raw is None else raw, separator))
+            self._cache[cache_key] = (raw, value)
+        # NOTE: new list on each call, because memoized value should not be changed by caller.
+        return list(value)
+
+    def get_bool(self, key: str, default: str = "") -> bool:
+        """Get environment variable as boolean."""
+        raw = (os.environ if self._environ is None else self._environ).get(key)
+        cache_key = ("bool", key, default)
+        cached = self._cache.get(cache_key, _NOT_CACHED)
+        if cached[0] == raw:
+            return cached[1]
+        value = _parse_bool(default if raw is None else raw)
+        self._cache[cache_key] = (raw, value)
+        return value
+
+    def get_int(self, key: str, default: int | None = None) -> int | None:
+        """Get environment variable as integer."""
+        raw = (os.environ if self._environ is None else self._environ).get(key)
+        cache_key = ("int", key, default)
+        cached = self._cache.get(cache_key, _NOT_CACHED)
+        if cached[0] == raw:
+            return cached[1]
+        value = _parse_int("" if raw is None else raw, default)
+        self._cache[cache_key] = (raw, value)
+        return value
+
+
+_DOTENV_LINE = re.compile(
+    rb"""
+    ^[ \t]*(?:export[ \t]+)?
+    (?P<key>[A-Za-z_][A-Za-z0-9_.-]*)[ \t]*=[ \t]*
+    (?:
+        '(?P<single>[^']*)'[ \t]*(?:\#[^\r\n]*)?
+        |"(?P<double>(?:\\.|[^"\\])*)"[ \t]*(?:\#[^\r\n]*)?
+        |(?P<bare>[^\r\n]*?)(?:[ \t]+\#[^\r\n]*)?[ \t]*
+    )\r?$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+_DOTENV_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+_DOTENV_ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def _unescape_dotenv_value(match: "re.Match[str]") -> str:
+    char = match.group(1)
+    return _DOTENV_ESCAPES.get(char, char)
+
+
+def parse_dotenv(path: "str | Path") -> dict[str, str]:
+    r"""Parse ``.env`` file into dict of variables.
+
+    File is memory-mapped and parsed by one precompiled regex in one pass, so it is not read
+    line by line and not copied into memory as whole. Not regular files (like pipes) are read
+    as whole. Supported syntax:
+
+    * ``KEY=value`` and ``export KEY=value`` lines;
+    * comments (``# comment`` lines and `` # comment`` after values) and empty lines;
+    * single-quoted values (taken as is) and double-quoted values (with ``\n``, ``\t``,
+      ``\"``-like escapes, may be multiline).
+
+    Variables expansion (``${OTHER}``) is not supported. Lines with invalid syntax are skipped.
+    """
+    with open(path, "rb") as file:  # noqa: PTH123
+        file_stat = os.fstat(file.fileno())
+        # NOTE: pipes (like ``/dev/stdin`` or ``<(...)``) can't be memory-mapped, and their size
+        # is unknown, so they are read as whole.
+        if not stat.S_ISREG(file_stat.st_mode):
+            return _parse_dotenv_buffer(file.read())
+        if file_stat.st_size == 0:
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _parse_dotenv_buffer(mapped)
+
+
+def _parse_dotenv_buffer(buffer: "bytes | mmap.mmap") -> dict[str, str]:
+    result: dict[str, str] = {}
+    for match in _DOTENV_LINE.finditer(buffer):  # type: ignore reportArgumentType
+        key, single, double, bare = match.groups()
+        if single is not None:
+            value = single.decode()
+        elif double is not None:
+            value = _DOTENV_ESCAPE.sub(_unescape_dotenv_value, double.decode())
+        else:
+            value = bare.decode()
+        result[key.decode()] = value
+    return result
+
+
+def load_dotenv(path: "str | Path", *, override: bool = False) -> dict[str, str]:
+    """Parse ``.env`` file and put its variables into ``os.environ``.
+
+    Variables, that are already set in environment, are not overridden unless ``override`` is
+    True. Returns all parsed variables.
+    """
+    values = parse_dotenv(path)
+    for key, value in values.items():
+        if override or key not in os.environ:
+            os.environ[key] = value
+    return values
+
+
+_default_snapshot = EnvSnapshot(live=True)
+
+
+def getenv_list(key: str, default: str = "", separator: str = ",") -> list[str]:
+    """Get environment variable as list of strings."""
+    return _default_snapshot.get_list(key, default, separator)
+
+
 def getenv_bool(key: str, default: str = "") -> bool:
     """Get environment variable as boolean."""
-    return os.getenv(key, default).lower() in ("1", "true", "yes", "t")
+    return _default_snapshot.get_bool(key, default)
 
 
 def getenv_int(key: str, default: int | None = None) -> int | None:
     """Get environment variable as integer."""
-    value = os.getenv(key, "")
+    return _default_snapshot.get_int(key, default)
+
+
+class EnvConfigError(ValueError):
+    """Error about missing or invalid environment variables of config.
+
+    Contains all found errors at once in ``errors`` attribute (env variable name -> reason).
+    """
+
+    def __init__(self, errors: dict[str, str]) -> None:
+        self.errors = errors
+        details = "\n".join(f"  {name}: {reason}" for name, reason in errors.items())
+        super().__init__(f"Environment config is not valid:\n{details}")
+
+
+def _parse_int_strict(value: str) -> int:
     try:
         return int(float(value))
-    except ValueError:
-        return default
+    except OverflowError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+_FIELD_PARSERS: dict[type[Any], Callable[..., Any]] = {
+    str: str,
+    int: _parse_int_strict,
+    float: float,
+    bool: _parse_bool,
+    list: _parse_list,
+}
+
+
+class EnvField:
+    """Declaration of one config field for ``EnvConfigLoader``.
+
+    Supported types are ``str``, ``int``, ``float``, ``bool`` and ``list`` (list of strings).
+    ``int``, ``bool`` and ``list`` values are parsed with the same rules, as ``getenv_int``,
+    ``getenv_bool`` and ``getenv_list`` use. If no default was passed, field is required.
+    """
+
+    __slots__ = ("default", "env_name", "separator", "type_")
+
+    def __init__(
+        self,
+        type_: type[Any] = str,
+        default: Any = _MISSING,  # noqa: ANN401
+        *,
+        separator: str = ",",
+        env_name: str | None = None,
+    ) -> None:
+        if type_ not in _FIELD_PARSERS:
+            msg = f"Type {type_!r} is not supported. Use one of {list(_FIELD_PARSERS)}."
+            raise TypeError(msg)
+        self.type_ = type_
+        self.default = default
+        self.separator = separator
+        self.env_name = env_name
+
+
+class EnvConfigLoader:
+    """Loader of many environment variables at once, described by declarative spec.
+
+    Spec is compiled once on loader creation: env names, parsers and defaults are resolved, so
+    ``load`` only takes one copy of environ and runs one loop over fields. All missing and
+    invalid variables are reported at once with ``EnvConfigError``.
+
+    Usage
+    -----
+
+    ```
+        loader = EnvConfigLoader(
+            {
+                "debug": bool,
+                "port": EnvField(int, 8000),
+                "allowed_hosts": EnvField(list, [], separator=";"),
+            },
+            prefix="APP_",
+        )
+        config = loader.load()  # {"debug": ..., "port": ..., "allowed_hosts": [...]}
+    ```
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, spec: Mapping[str, EnvField | type[Any]], *, prefix: str = "") -> None:
+        fields: list[tuple[str, str, Callable[[str], Any], Any]] = []
+        for name, declaration in spec.items():
+            field = declaration if isinstance(declaration, EnvField) else EnvField(declaration)
+            parser = _FIELD_PARSERS[field.type_]
+            if field.type_ is list:
+                parser = functools.partial(_parse_list, separator=field.separator)
+            env_name = field.env_name if field.env_name is not None else (prefix + name).upper()
+            fields.append((name, env_name, parser, field.default))
+        self._fields = tuple(fields)
+
+    def load(self, environ: Mapping[str, str] | None = None) -> dict[str, Any]:
+        """Load config values from given environ (``os.environ`` by default).
+
+        Raises
+        ------
+        EnvConfigError
+            if some required variables are missing or some variables have invalid values.
+        """
+        source = dict(os.environ if environ is None else environ)
+        result: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for name, env_name, parser, default in self._fields:
+            raw = source.get(env_name)
+            if raw is None:
+                if default is _MISSING:
+                    errors[env_name] = "variable is not set"
+                else:
+                    result[name] = default.copy() if isinstance(default, list) else default
+                continue
+            try:
+                result[name] = parser(raw)
+            except ValueError as exc:
+                errors[env_name] = f"invalid value {raw!r} ({exc})"
+        if errors:
+            raise EnvConfigError(errors)
+        return result
@@ -1,8 +1,25 @@
 """Module with functions, that make some data more human-friendly."""
 
+import array
+import functools
+import re
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 SIZEOF_UNIT = ["", "K", "M", "G", "T", "P", "E", "Z"]
 SIZEOF_SEPARATOR = 1024.0
 
+_SIZEOF_ALL_UNITS = [*SIZEOF_UNIT, "Y"]
+# NOTE: value with abs(value) >= _SIZEOF_THRESHOLDS[i] needs unit with index > i.
+_SIZEOF_THRESHOLDS = [SIZEOF_SEPARATOR**power for power in range(1, len(_SIZEOF_ALL_UNITS))]
+_SIZEOF_DIVISORS = [SIZEOF_SEPARATOR**power for power in range(len(_SIZEOF_ALL_UNITS))]
+_SIZEOF_MULTIPLIERS = {
+    unit.upper(): int(SIZEOF_SEPARATOR) ** power for power, unit in enumerate(_SIZEOF_ALL_UNITS)
+}
+
 
 def sizeof_fmt(num: float, *, suffix: str = "b", force_float: bool = False) -> str:
     """Make sizeof value more human-friendly.
@@ -20,3 +37,117 @@ def sizeof_fmt(num: float, *, suffix: str = "b", force_float: bool = False) -> s
     if force_float or int(num) != num:
         return f"{num:.1f}Y{suffix}"
     return f"{int(num)}Y{suffix}"
+
+
+def _numpy_scale_sizes(values: Any) -> tuple[list[Any], list[int]]:  # noqa: ANN401
+    """Find units for all values of NumPy array at once and scale values to them.
+
+    Values without unit keep their original type (int stays int), like in ``sizeof_fmt``.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    floats = np.asarray(values, dtype=np.float64)
+    indexes = np.searchsorted(_SIZEOF_THRESHOLDS, np.abs(floats), side="right")
+    scaled = floats / np.asarray(_SIZEOF_DIVISORS)[indexes]
+    index_list = indexes.tolist()
+    return [
+        raw if index == 0 else num
+        for raw, num, index in zip(values.tolist(), scaled.tolist(), index_list, strict=True)
+    ], index_list
+
+
+def sizeof_fmt_many(
+    values: "Iterable[float] | array.array[Any] | Any",  # noqa: ANN401
+    *,
+    suffix: str = "b",
+    force_float: bool = False,
+) -> list[str]:
+    """Make many sizeof values more human-friendly at once.
+
+    Works with any iterable of numbers, ``array.array`` and NumPy arrays (if NumPy is
+    installed). Result is the same, as ``sizeof_fmt`` returns for each value, but unit for each
+    value is found by one thresholds lookup instead of repeated division. For NumPy arrays units
+    are found for all values at once.
+    """
+    unit_suffixes = [unit + suffix for unit in _SIZEOF_ALL_UNITS]
+    if isinstance(values, array.array):
+        values = values.tolist()
+    elif type(values).__module__ == "numpy":
+        scaled, indexes = _numpy_scale_sizes(values)
+        return [
+            (
+                f"{num:.1f}{unit_suffixes[index]}"
+                if force_float or int(num) != num
+                else f"{int(num)}{unit_suffixes[index]}"
+            )
+            for num, index in zip(scaled, indexes, strict=True)
+        ]
+    thresholds, divisors = _SIZEOF_THRESHOLDS, _SIZEOF_DIVISORS
+    separator = SIZEOF_SEPARATOR
+    result: list[str] = []
+    append = result.append
+    for num in values:
+        if -separator < num < separator:
+            unit_suffix = unit_suffixes[0]
+        else:
+            index = bisect_right(thresholds, abs(float(num)))
+            num /= divisors[index]  # noqa: PLW2901
+            unit_suffix = unit_suffixes[index]
+        if force_float or int(num) != num:
+            append(f"{num:.1f}{unit_suffix}")
+        else:
+            append(f"{int(num)}{unit_suffix}")
+    return result
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_size_pattern(suffix: str) -> "re.Pattern[str]":
+    units = "".join(unit for unit in _SIZEOF_ALL_UNITS if unit)
+    return re.compile(
+        rf"\s*(?P<number>[-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*"
+        rf"(?P<unit>[{units}]?)(?:{re.escape(suffix)})?\s*",
+        re.IGNORECASE,
+    )
+
+
+def _parse_size(fullmatch: "Callable[[str], re.Match[str] | None]", value: str) -> int:
+    match = fullmatch(value)
+    if match is None:
+        msg = f"Invalid size value: {value!r}."
+        raise ValueError(msg)
+    number, unit = match.group("number", "unit")
+    multiplier = _SIZEOF_MULTIPLIERS[unit.upper()]
+    if "." in number:
+        return round(float(number) * multiplier)
+    return int(number) * multiplier
+
+
+def parse_size(value: str, *, suffix: str = "b") -> int:
+    """Convert human-friendly size string back to number of bytes.
+
+    Reverse function for ``sizeof_fmt``: uses the same units and separator. Unit and suffix are
+    optional and case-insensitive. Fractional sizes are rounded to the nearest integer.
+
+    Examples
+    --------
+    >>> parse_size('1Kb')
+    1024
+    >>> parse_size('1.5Gb')
+    1610612736
+    >>> parse_size('512K')
+    524288
+    >>> parse_size('100')
+    100
+    """
+    return _parse_size(_compile_size_pattern(suffix).fullmatch, value)
+
+
+def parse_sizes(values: "Iterable[str]", *, suffix: str = "b") -> "Iterator[int]":
+    """Lazily convert many human-friendly size strings to numbers of bytes.
+
+    Works with any iterable (like lines of log file) without building intermediate lists. Raises
+    ``ValueError`` on first invalid value.
+    """
+    fullmatch = _compile_size_pattern(suffix).fullmatch
+    for value in values:
+        yield _parse_size(fullmatch, value)
@@ -3,7 +3,40 @@
 Contains functions to inspect objects or extract information from them
 """
 
-import inspect
+import builtins
+import functools
+import importlib
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from dev_utils.results import Ok, Result
+
+# NOTE: keys are plain weak references without callback. ``weakref.ref(cls)`` returns the same
+# existing reference object on each call, so cache lookup is one dict hit without allocations.
+# Separate references with callback remove cache entries, when classes are garbage collected.
+_class_names: dict["weakref.ref[type]", str] = {}
+_class_names_cleanups: dict["weakref.ref[type]", "weakref.ref[type]"] = {}
+
+
+def _class_absolute_name(class_: type) -> str:
+    module = class_.__module__
+    return class_.__qualname__ if module == "builtins" else module + "." + class_.__qualname__
+
+
+def _cache_class_name(class_: type) -> str:
+    name = _class_absolute_name(class_)
+    key = weakref.ref(class_)
+
+    def _remove(_: "weakref.ref[type]", key: "weakref.ref[type]" = key) -> None:
+        _class_names.pop(key, None)
+        _class_names_cleanups.pop(key, None)
+
+    _class_names[key] = name
+    _class_names_cleanups[key] = weakref.ref(class_, _remove)
+    return name
 
 
 def get_object_class_absolute_name(obj: object) -> str:
@@ -12,9 +45,86 @@ def get_object_class_absolute_name(obj: object) -> str:
     Absolute name is name with all modules, which this object is contains in. For example,
     we have package ``my_package`` with module ``my_module`` with class ``MyClass``. This Function
     will return ``my_package.my_module.MyClass``
+
+    Names are cached per class with weak references, so repeated calls cost one dict hit and
+    classes are not kept alive by cache. Names of unhashable classes are not cached.
     """
-    class_ = obj if inspect.isclass(obj) else obj.__class__
-    module = class_.__module__
-    if module == "builtins":
-        return class_.__qualname__
-    return module + "." + class_.__qualname__
+    class_ = obj if isinstance(obj, type) else obj.__class__
+    try:
+        name = _class_names.get(weakref.ref(class_))
+    except TypeError:
+        # NOTE: classes of metaclass with ``__eq__`` and without ``__hash__`` are unhashable, so
+        # their names are not cached.
+        return _class_absolute_name(class_)
+    if name is None:
+        return _cache_class_name(class_)
+    return name
+
+
+def get_objects_class_absolute_names(objects: "Iterable[object]") -> list[str]:
+    """Get class absolute names of all given objects.
+
+    Bulk version of ``get_object_class_absolute_name``.
+    """
+    get_name, ref, type_ = _class_names.get, weakref.ref, type
+    result: list[str] = []
+    append = result.append
+    for obj in objects:
+        class_ = obj if isinstance(obj, type_) else obj.__class__
+        try:
+            name = get_name(ref(class_))
+        except TypeError:  # unhashable class
+            append(_class_absolute_name(class_))
+            continue
+        append(_cache_class_name(class_) if name is None else name)
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_absolute_name(name: str) -> "Ok[Any]":
+    # NOTE: ``dev_utils.results`` imports ``inspect`` module, which is quite expensive, so it is
+    # imported only when names are resolved.
+    from dev_utils.results import Ok  # noqa: PLC0415
+
+    parts = name.split(".")
+    if not all(parts):
+        msg = f"Invalid absolute name: {name!r}."
+        raise ImportError(msg, name=name)
+    obj: Any = builtins
+    resolved = 0
+    for index in range(1, len(parts) + 1):
+        module_name = ".".join(parts[:index])
+        try:
+            obj = importlib.import_module(module_name)
+        except ModuleNotFoundError as exc:
+            # NOTE: only missing module itself means, that the rest of name is qualname. Missing
+            # dependencies of existing module are real errors.
+            if exc.name != module_name:
+                raise
+            break
+        resolved = index
+    for index in range(resolved, len(parts)):
+        try:
+            obj = getattr(obj, parts[index])
+        except AttributeError as exc:
+            msg = f"Cannot resolve {name!r}: {exc}"
+            raise ImportError(msg, name=name) from exc
+    return Ok(obj)
+
+
+def resolve_absolute_name(name: str) -> "Result[Any, ImportError]":
+    """Get object by its absolute name.
+
+    Reverse function for ``get_object_class_absolute_name``: accepts dotted names with nested
+    qualnames (like ``my_package.my_module.MyClass.Nested``) and names of builtins (like
+    ``int``). Modules are imported lazily on the first resolution of name.
+
+    Successful results are kept in LRU cache, so repeated resolution costs one dict hit. Failed
+    resolutions are not cached and returned as ``Err`` with ``ImportError`` instead of raising.
+    """
+    try:
+        return _resolve_absolute_name(name)
+    except ImportError as exc:
+        from dev_utils.results import Err  # noqa: PLC0415
+
+        return Err(exc)
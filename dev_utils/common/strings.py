@@ -1,11 +1,30 @@
 """Module with strings utils."""
 
+import functools
 import re
+from string import Formatter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import TextIO
+
+_FORMAT_BRACKETS = re.compile(r"[{}]")
+_FORMAT_INVALID_START = re.compile(
+    r"(\{[\"\!\"\#\$\%\&\'\(\)\*\+\,\-\.\/\:\;\<\=\>\?\@\[\\\]\^\_\`\|\~]+\})|(\{\d+\w*\})",
+)
+_FORMAT_FIELD_ROOT = re.compile(r"[.\[]")
+_FORMAT_CONVERSIONS = frozenset(("r", "s", "a"))
+_PLAIN_TEXT_SPACES = re.compile(r"[ \n]+")
+_PLAIN_TEXT_REGEX_MIN_LENGTH = 256
 
 
 def has_format_brackets(value: str) -> bool:
     """Check string for formatting brackets.
 
+    Only brackets are scanned (in one pass) to check their balance, and the rest checks are
+    made with precompiled regex and C-level substring counts.
+
     Examples
     --------
     >>> has_format_brackets('{}')
@@ -19,39 +38,224 @@ def has_format_brackets(value: str) -> bool:
     >>> has_format_brackets('{!}')
     False  # because this string can't be formatted - any formats will cause error.
     """
-    stack: list[str] = []
-    mapping = {"}": "{"}
-    balanced = True
-    for char in value:
-        if char == "}":
-            top_element = stack.pop() if stack else "#"
-            if mapping[char] != top_element:
-                balanced = False
-                break
-        elif char == "{":
-            stack.append(char)
-    is_valid = not stack if balanced else balanced
-    if not is_valid:
-        return is_valid
-    pattern = (
-        r"(\{[\"\!\"\#\$\%\&\'\(\)\*\+\,\-\.\/\:\;\<\=\>\?\@\[\\\]\^\_\`\|\~]+\})|(\{\d+\w*\})"
-    )
-    if re.match(pattern, value):
+    depth = opened = 0
+    for bracket in _FORMAT_BRACKETS.findall(value):
+        if bracket == "{":
+            depth += 1
+            opened += 1
+        elif depth == 0:
+            return False
+        else:
+            depth -= 1
+    if depth or not opened or _FORMAT_INVALID_START.match(value):
         return False
-    left_count = value.count("{")
-    right_count = value.count("}")
-    escaped_left = 0
-    escaped_right = value.count("\\}")
-    return (
-        (left_count - (escaped_left * 2) != 0)
-        and (right_count - (escaped_right * 2) != 0)
-        and (left_count == right_count)
-    )
+    # NOTE: brackets are balanced here, so there are as many closing brackets as opening ones.
+    return opened != value.count("\\}") * 2
+
+
+class CompiledTemplate:
+    """Format template, that was validated and parsed once.
+
+    Rendering uses bound ``str.format`` of the template, so no validation and no Python-level
+    parsing is made on each render.
+    """
+
+    __slots__ = ("_format", "_format_map", "fields", "template")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.fields = self._parse_fields(template)
+        self._format = template.format
+        self._format_map = template.format_map
+
+    @staticmethod
+    def _parse_fields(template: str) -> tuple[str, ...]:
+        fields: dict[str, None] = {}
+        pending = [(template, 0)]
+        while pending:
+            source, depth = pending.pop()
+            try:
+                parsed = list(Formatter().parse(source))
+            except ValueError as exc:
+                msg = f"Invalid format template {template!r}: {exc}."
+                raise ValueError(msg) from exc
+            for _, field_name, format_spec, conversion in parsed:
+                if field_name is None:
+                    continue
+                if depth > 1:
+                    msg = f"Invalid format template {template!r}: max nesting level exceeded."
+                    raise ValueError(msg)
+                if conversion is not None and conversion not in _FORMAT_CONVERSIONS:
+                    msg = (
+                        f"Invalid format template {template!r}: unknown conversion {conversion!r}."
+                    )
+                    raise ValueError(msg)
+                fields[_FORMAT_FIELD_ROOT.split(field_name, maxsplit=1)[0]] = None
+                if format_spec:
+                    # NOTE: format spec can contain nested fields, like "{value:{width}}".
+                    pending.append((format_spec, depth + 1))
+        names = tuple(fields)
+        if "" in names and any(name.isdigit() for name in names):
+            msg = (
+                f"Invalid format template {template!r}: automatic and manual field numbering "
+                "can't be mixed."
+            )
+            raise ValueError(msg)
+        return names
+
+    def render(self, *args: Any, **kwargs: Any) -> str:  # noqa: ANN401
+        """Render template with given positional and keyword values."""
+        return self._format(*args, **kwargs)
+
+    def render_map(self, values: "Mapping[str, Any]") -> str:
+        """Render template with values from given mapping (without copying it)."""
+        return self._format_map(values)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"CompiledTemplate({self.template!r})"
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_template(template: str) -> CompiledTemplate:
+    """Validate and parse format template once and return its fast renderer.
+
+    Compiled templates are kept in bounded LRU cache, so repeated calls with the same template
+    cost one cache hit. Invalid template raises ``ValueError`` on compile, not on render.
+
+    Usage
+    -----
+
+    ```
+        template = compile_template("Hello, {user.name}! You have {count} new messages.")
+        template.fields  # ("user", "count")
+        template.render(user=user, count=5)
+    ```
+    """
+    return CompiledTemplate(template)
 
 
 def trim_and_plain_text(text: str) -> str:
-    """Make text plain and trim."""
+    r"""Make text plain and trim.
+
+    Strip text and replace each run of spaces and newlines with one space. Long texts are
+    processed in one regex pass, so cost stays linear even on long runs of spaces.
+
+    Examples
+    --------
+    >>> trim_and_plain_text('   abc  \n  abc   ')
+    'abc abc'
+    """
     text = text.strip()
+    if len(text) > _PLAIN_TEXT_REGEX_MIN_LENGTH:
+        return _PLAIN_TEXT_SPACES.sub(" ", text)
+    # NOTE: for short texts few C-level replaces are much cheaper, than regex substitution.
+    if "\n" in text:
+        text = text.replace("\n", " ")
     while "  " in text:
         text = text.replace("  ", " ")
-    return text.replace("\n", " ").strip()
+    return text
+
+
+class PlainTextNormalizer:
+    """Batch ``trim_and_plain_text`` with deduplication of repeated texts.
+
+    Results are kept in bounded LRU cache, so repeated texts (like product titles) are
+    normalized only once. Cache statistics are available with ``cache_info``.
+
+    Usage
+    -----
+
+    ```
+        normalizer = PlainTextNormalizer(cache_size=100_000)
+        titles = normalizer.normalize_many(raw_titles)
+        normalizer.cache_info()  # CacheInfo(hits=..., misses=..., maxsize=..., currsize=...)
+    ```
+    """
+
+    __slots__ = ("_normalize",)
+
+    def __init__(self, cache_size: int | None = 65536) -> None:
+        self._normalize = functools.lru_cache(maxsize=cache_size)(trim_and_plain_text)
+
+    def normalize(self, text: str) -> str:
+        """Normalize one text with cache."""
+        return self._normalize(text)
+
+    def normalize_many(
+        self,
+        texts: "Iterable[str]",
+        *,
+        processes: int | None = None,
+        chunksize: int = 4096,
+    ) -> list[str]:
+        """Normalize all given texts and return results in the same order.
+
+        If ``processes`` is passed, unique texts of the batch are normalized in process pool of
+        given size. It makes sense only for very large batches of long texts: LRU cache is not
+        used (and its statistics are not changed) in this mode.
+        """
+        if processes is None:
+            return list(map(self._normalize, texts))
+        # NOTE: concurrent.futures import is quite expensive, so it is done only when needed.
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        texts = texts if isinstance(texts, list) else list(texts)
+        unique_texts = list(dict.fromkeys(texts))
+        with ProcessPoolExecutor(processes) as executor:
+            normalized = dict(
+                zip(
+                    unique_texts,
+                    executor.map(trim_and_plain_text, unique_texts, chunksize=chunksize),
+                    strict=True,
+                ),
+            )
+        return [normalized[text] for text in texts]
+
+    def cache_info(self) -> "functools._CacheInfo":
+        """Get cache statistics: hits, misses, max and current size."""
+        return self._normalize.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear cache and its statistics."""
+        self._normalize.cache_clear()
+
+
+def trim_and_plain_text_many(texts: "Iterable[str]", *, cache_size: int = 65536) -> list[str]:
+    """Make many texts plain and trim, normalizing each unique text only once.
+
+    Result is the same, as ``trim_and_plain_text`` returns for each text. Use
+    ``PlainTextNormalizer`` to keep cache between batches or to use process pool.
+    """
+    return PlainTextNormalizer(cache_size).normalize_many(texts)
+
+
+def iter_trim_and_plain_text(
+    source: "Iterable[str] | TextIO",
+    *,
+    chunk_size: int = 65536,
+) -> "Iterator[str]":
+    """Make text plain and trim chunk by chunk.
+
+    Streaming version of ``trim_and_plain_text``: accepts any iterable of text chunks or text
+    file object (read by ``chunk_size`` characters) and yields normalized parts. Trailing
+    whitespaces of each chunk are kept until next chunk, so runs of spaces and newlines on chunk
+    boundaries are replaced correctly. Joined output is equal to ``trim_and_plain_text`` result
+    for the whole text.
+    """
+    chunks = source
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), "")  # type: ignore reportAttributeAccessIssue
+    started = False
+    pending = ""
+    for chunk in chunks:
+        text = pending + chunk
+        if not started:
+            text = text.lstrip()
+            if not text:
+                continue
+            started = True
+        content = text.rstrip()
+        # NOTE: whitespaces are collapsed, so pending part will not grow on long runs of them.
+        pending = _PLAIN_TEXT_SPACES.sub(" ", text[len(content) :])
+        if content:
+            yield _PLAIN_TEXT_SPACES.sub(" ", content)
@@ -0,0 +1,410 @@
+"""Module with low-overhead instrumentation of hot paths.
+
+Calls of decorated functions and executions of code blocks are counted, and their durations are
+recorded into preallocated fixed-bucket histograms, so recording never allocates and memory
+usage does not grow with number of calls.
+
+Recording is switched on with ``DEV_UTILS_PROFILING`` environment variable (any value, that
+``getenv_bool`` treats as true). When it is off, decorators return functions as is and blocks
+are shared no-op context managers, so instrumented code costs (almost) nothing.
+
+Counters are not locked: concurrent recordings from many threads may rarely lose updates. It is
+the price of low overhead, and it does not matter for statistics.
+"""
+
+import array
+import contextlib
+import functools
+import math
+import time
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from types import TracebackType
+from typing import Any, ParamSpec, TypeVar, overload
+
+from dev_utils.common import get_object_class_absolute_name, getenv_bool, sizeof_fmt
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+PROFILING_ENV = "DEV_UTILS_PROFILING"
+# NOTE: 4 buckets per power of 2 (about 19% between bounds) from 64ns to about 16 minutes.
+DEFAULT_BOUNDS: tuple[int, ...] = tuple(round(2 ** (power / 4)) for power in range(24, 160))
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+_DISABLED_BLOCK = contextlib.nullcontext()
+_DURATION_UNITS = ("ns", "us", "ms")
+
+
+class Histogram:
+    """Histogram of integer values (like durations in nanoseconds) with fixed buckets.
+
+    Bucket with index ``i`` counts values in ``[bounds[i - 1], bounds[i])``, first and last
+    buckets count values below first bound and not below last bound. Counts are kept in
+    preallocated ``array.array``, and bucket of value is found by binary search.
+
+    Percentiles are estimated by upper bound of bucket, that contains them, so their precision
+    depends on distance between bounds. Exact maximum and total are kept too.
+    """
+
+    __slots__ = ("_counts", "bounds", "max", "total")
+
+    def __init__(self, bounds: Sequence[int] = DEFAULT_BOUNDS) -> None:
+        self.bounds = tuple(bounds)
+        self._counts = array.array("Q", bytes(8 * (len(self.bounds) + 1)))
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """Record one value."""
+        self._counts[bisect_right(self.bounds, value)] += 1
+        self.total += value
+        if value > self.max:  # noqa: PLR1730
+            self.max = value
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return sum(self._counts)
+
+    @property
+    def counts(self) -> list[int]:
+        """Counts of values in each bucket."""
+        return self._counts.tolist()
+
+    @property
+    def mean(self) -> float:
+        """Mean of recorded values (0, if nothing was recorded)."""
+        count = self.count
+        return self.total / count if count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """Estimate given percentile of recorded values (0, if nothing was recorded)."""
+        count = self.count
+        if not count:
+            return 0
+        rank = max(1, math.ceil(count * percent / 100))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):  # noqa: B007
+            cumulative += bucket_count
+            if cumulative >= rank:
+                break
+        if index == len(self.bounds):
+            return self.max
+        return min(self.bounds[index], self.max)
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        self._counts = array.array("Q", bytes(8 * (len(self.bounds) + 1)))
+        self.total = self.max = 0
+
+
+class CallStats:
+    """Statistics of calls of one instrumented function or code block.
+
+    Durations are in nanoseconds. ``size`` is total size (for example, in bytes) of data, that
+    was processed by code blocks, if it was passed to them.
+    """
+
+    __slots__ = ("errors", "histogram", "label", "size")
+
+    def __init__(self, label: str, bounds: Sequence[int] = DEFAULT_BOUNDS) -> None:
+        self.label = label
+        self.histogram = Histogram(bounds)
+        self.errors = 0
+        self.size = 0
+
+    @property
+    def calls(self) -> int:
+        """Number of calls."""
+        return self.histogram.count
+
+    @property
+    def total(self) -> int:
+        """Total duration of all calls in nanoseconds."""
+        return self.histogram.total
+
+    def percentile(self, percent: float) -> int:
+        """Estimate given percentile of call duration in nanoseconds."""
+        return self.histogram.percentile(percent)
+
+
+class _Block:
+    __slots__ = ("_clock", "_size", "_start", "_stats")
+
+    def __init__(self, stats: CallStats, clock: Callable[[], int], size: int) -> None:
+        self._stats = stats
+        self._clock = clock
+        self._size = size
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = self._clock()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        stats = self._stats
+        stats.histogram.record(self._clock() - self._start)
+        stats.size += self._size
+        if exc_type is not None and issubclass(exc_type, Exception):
+            stats.errors += 1
+
+
+def format_duration(value: float) -> str:
+    """Make duration in nanoseconds more human-friendly.
+
+    Examples
+    --------
+    >>> format_duration(1500)
+    '1.5us'
+    >>> format_duration(2_000_000_000)
+    '2.0s'
+    """
+    for unit in _DURATION_UNITS:
+        if abs(value) < 1000:  # noqa: PLR2004
+            return f"{value:.1f}{unit}"
+        value /= 1000
+    return f"{value:.1f}s"
+
+
+def _get_label(func: Callable[..., Any]) -> str:
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None:
+        # NOTE: callable objects (like ``functools.partial``) are labelled by their classes.
+        return get_object_class_absolute_name(func)
+    return f"{func.__module__}.{qualname}"
+
+
+class Profiler:
+    """Registry of call statistics of instrumented functions and code blocks.
+
+    If ``enabled`` is not passed, it is read from ``DEV_UTILS_PROFILING`` environment variable.
+    It is checked, when function is decorated or block is entered, so switching it does not
+    affect already decorated functions. ``clock`` should return nanoseconds.
+
+    Usage
+    -----
+
+    ```
+        profiler = Profiler(enabled=True)
+
+        @profiler.profile
+        def handle(request: Request) -> Response:
+            ...
+
+        with profiler.block("parse payload", size=len(payload)):
+            data = json.loads(payload)
+
+        print(profiler.report())
+    ```
+    """
+
+    __slots__ = ("_clock", "_stats", "bounds", "enabled")
+
+    def __init__(
+        self,
+        *,
+        enabled: bool | None = None,
+        bounds: Sequence[int] = DEFAULT_BOUNDS,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        self.enabled = getenv_bool(PROFILING_ENV) if enabled is None else enabled
+        self.bounds = tuple(bounds)
+        self._clock = clock
+        self._stats: dict[str, CallStats] = {}
+
+    def get_stats(self, label: str) -> CallStats:
+        """Get statistics of given label (empty statistics are created, if there is no such)."""
+        stats = self._stats.get(label)
+        if stats is None:
+            stats = self._stats[label] = CallStats(label, self.bounds)
+        return stats
+
+    @property
+    def stats(self) -> dict[str, CallStats]:
+        """Statistics of all labels."""
+        return dict(self._stats)
+
+    @overload
+    def profile(self, func: Callable[P, R], /) -> Callable[P, R]: ...
+
+    @overload
+    def profile(
+        self,
+        *,
+        label: str | None = None,
+    ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+
+    def profile(
+        self,
+        func: Callable[P, R] | None = None,
+        /,
+        *,
+        label: str | None = None,
+    ) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+        """Record calls of decorated function.
+
+        Function is labelled by its absolute name (like ``my_package.my_module.MyClass.method``),
+        if ``label`` is not passed. Coroutine functions are supported: whole awaiting of
+        coroutine is measured. For generator functions whole iteration is measured, including
+        time, that consumer spends between items. Only ``Exception`` subclasses are counted as
+        errors, so cancellation or interruption is not an error.
+        """
+        if func is None:
+            return functools.partial(self._decorate, label=label)  # type: ignore reportReturnType
+        return self._decorate(func, label=label)
+
+    def _decorate(self, func: Callable[P, R], *, label: str | None) -> Callable[P, R]:
+        if not self.enabled:
+            return func
+        # NOTE: inspect import is quite expensive, so it is done only when profiling is on.
+        import inspect  # noqa: PLC0415
+
+        stats = self.get_stats(_get_label(func) if label is None else label)
+        record, clock = stats.histogram.record, self._clock
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # noqa: ANN401
+                start = clock()
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    record(clock() - start)
+
+            return async_wrapper  # type: ignore reportReturnType
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # noqa: ANN401
+                start = clock()
+                try:
+                    return (yield from func(*args, **kwargs))
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    record(clock() - start)
+
+            return generator_wrapper  # type: ignore reportReturnType
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                record(clock() - start)
+
+        return wrapper
+
+    def block(self, label: str, *, size: int = 0) -> contextlib.AbstractContextManager[None]:
+        """Record execution of code block.
+
+        ``size`` is size of data (for example, in bytes), that block processes. Report shows
+        total processed size and throughput, if it was passed.
+        """
+        if not self.enabled:
+            return _DISABLED_BLOCK
+        return _Block(self.get_stats(label), self._clock, size)
+
+    def report(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> str:
+        """Render statistics of all labels as table, sorted by total duration."""
+        header = ["label", "calls", "errors", "total", "mean"]
+        header += [f"p{percent:g}" for percent in percentiles]
+        header += ["max", "size", "throughput"]
+        rows = [header]
+        for stats in sorted(self._stats.values(), key=lambda stats: stats.total, reverse=True):
+            histogram = stats.histogram
+            row = [stats.label, str(stats.calls), str(stats.errors)]
+            row += [format_duration(histogram.total), format_duration(histogram.mean)]
+            row += [format_duration(histogram.percentile(percent)) for percent in percentiles]
+            row.append(format_duration(histogram.max))
+            if stats.size and histogram.total:
+                throughput = stats.size / (histogram.total / 1e9)
+                row += [sizeof_fmt(stats.size), sizeof_fmt(throughput, suffix="b/s")]
+            else:
+                row += ["-", "-"]
+            rows.append(row)
+        widths = [max(map(len, column)) for column in zip(*rows, strict=True)]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [value.rjust(width) for value, width in zip(row[1:], widths[1:], strict=True)],
+            )
+            for row in rows
+        )
+
+    def reset(self) -> None:
+        """Forget all recorded statistics."""
+        for stats in self._stats.values():
+            stats.histogram.reset()
+            stats.errors = stats.size = 0
+
+
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Get default profiler, that is used by ``profile`` and ``profile_block``."""
+    return _profiler
+
+
+@overload
+def profile(func: Callable[P, R], /) -> Callable[P, R]: ...
+
+
+@overload
+def profile(*, label: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+
+
+def profile(
+    func: Callable[P, R] | None = None,
+    /,
+    *,
+    label: str | None = None,
+) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+    """Record calls of decorated function with default profiler.
+
+    Usage
+    -----
+
+    ```
+        @profile
+        def handle(request: Request) -> Response:
+            ...
+
+        @profile(label="db.fetch_users")
+        async def fetch_users() -> list[User]:
+            ...
+
+        print(get_profiler().report())
+    ```
+    """
+    if func is None:
+        return _profiler.profile(label=label)
+    return _profiler.profile(func, label=label)
+
+
+def profile_block(label: str, *, size: int = 0) -> contextlib.AbstractContextManager[None]:
+    """Record execution of code block with default profiler.
+
+    Usage
+    -----
+
+    ```
+        with profile_block("parse payload", size=len(payload)):
+            data = json.loads(payload)
+    ```
+    """
+    return _profiler.block(label, size=size)
@@ -1,7 +1,11 @@
 """Rust-like error handling."""
 
-from typing import Generic, NoReturn, TypeVar, final
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Iterator
+from typing import Any, Generic, NoReturn, ParamSpec, TypeVar, final
 
+P = ParamSpec("P")
 Value = TypeVar("Value")
 Error = TypeVar("Error", bound=Exception)
 DefaultT = TypeVar("DefaultT")
@@ -9,11 +13,17 @@ DefaultT = TypeVar("DefaultT")
 
 @final
 class Ok(Generic[Value]):
-    """Success result class."""
+    """Success result class.
 
-    _value: Value
+    Instances are slotted and should be treated as immutable. For the most common values use
+    shared ``OK_NONE``, ``OK_TRUE`` and ``OK_FALSE`` instances instead of allocating new ones.
+    """
+
+    __slots__ = ("_value",)
     __match_args__ = ("_value",)
 
+    _value: Value
+
     def __init__(self, value: Value) -> None:
         self._value = value
 
@@ -21,7 +31,7 @@ class Ok(Generic[Value]):
         return f"Ok({self._value!r})"
 
     def __eq__(self, other: object) -> bool:  # noqa: D105
-        if isinstance(other, Ok) and type(self) is type(other):  # type: ignore reportUnknownArgumentType
+        if type(other) is Ok:
             return self._value == other._value  # type: ignore reportUnknownMemberType
         return False
 
@@ -34,21 +44,38 @@ class Ok(Generic[Value]):
         return self._value
 
 
+OK_NONE: Ok[None] = Ok(None)
+OK_TRUE: Ok[bool] = Ok(True)  # noqa: FBT003
+OK_FALSE: Ok[bool] = Ok(False)  # noqa: FBT003
+
+
 @final
 class Err(Generic[Error]):
     """Error result class."""
 
-    _err: Error
+    __slots__ = ("_err",)
     __match_args__ = ("_err",)
 
+    _err: Error
+
     def __init__(self, err: Error) -> None:
         self._err = err
 
+    @classmethod
+    def lightweight(cls, err: Error, *, keep_stack: bool = False) -> "Err[Error]":
+        """Create error result, that does not keep traceback frames of given error alive.
+
+        Traceback keeps all frames (and their locals) alive, so storing many errors makes memory
+        grow a lot. This constructor drops tracebacks of given error and its chained errors. If
+        ``keep_stack`` is True, compact stack summary is kept in error notes.
+        """
+        return cls(strip_traceback(err, keep_stack=keep_stack))
+
     def __repr__(self) -> str:  # noqa: D105
         return f"Err({self._err!r})"
 
     def __eq__(self, other: object) -> bool:  # noqa: D105
-        if isinstance(other, Err) and type(self) is type(other):  # type: ignore reportUnknownArgumentType
+        if type(other) is Err:
             return self._err.args == other._err.args  # type: ignore reportUnknownMemberType
         return False
 
@@ -62,3 +89,238 @@ class Err(Generic[Error]):
 
 
 Result = Ok[Value] | Err[Error]
+
+
+def _format_compact_stack(exc: BaseException) -> str:
+    lines = ["Stack (most recent call last):"]
+    tb = exc.__traceback__
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        lines.append(f"  {code.co_filename}:{tb.tb_lineno} in {code.co_name}")
+        tb = tb.tb_next
+    return "\n".join(lines)
+
+
+def strip_traceback(exc: Error, *, keep_stack: bool = False) -> Error:
+    """Drop traceback of given exception and all its chained (or grouped) exceptions.
+
+    If ``keep_stack`` is True, compact summary of dropped traceback (file, line and function
+    name of each frame) is added to exception notes, so it is still visible on raise.
+    """
+    seen: set[int] = set()
+    pending: list[BaseException] = [exc]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if current.__traceback__ is not None:
+            if keep_stack:
+                current.add_note(_format_compact_stack(current))
+            current.__traceback__ = None
+        if isinstance(current, BaseExceptionGroup):
+            pending.extend(current.exceptions)
+        pending.extend(chained for chained in (current.__cause__, current.__context__) if chained)
+    return exc
+
+
+def collect(results: Iterable[Result[Value, Error]]) -> Result[list[Value], Error]:
+    """Collect values of all results into one ``Ok`` list or return first ``Err``.
+
+    Iteration stops on first ``Err``, so rest of given iterable will not be consumed.
+    """
+    values: list[Value] = []
+    append = values.append
+    for result in results:
+        if type(result) is Err:
+            return result
+        append(result._value)  # type: ignore reportAttributeAccessIssue  # noqa: SLF001
+    return Ok(values)
+
+
+def partition(results: Iterable[Result[Value, Error]]) -> tuple[list[Value], list[Error]]:
+    """Split results into list of success values and list of errors in one pass."""
+    values: list[Value] = []
+    errors: list[Error] = []
+    append_value, append_error = values.append, errors.append
+    for result in results:
+        if type(result) is Ok:
+            append_value(result._value)  # noqa: SLF001
+        else:
+            append_error(result._err)  # type: ignore reportAttributeAccessIssue  # noqa: SLF001
+    return values, errors
+
+
+def iter_oks(results: Iterable[Result[Value, Error]]) -> Iterator[Value]:
+    """Lazily iterate over values of ``Ok`` results, skipping errors."""
+    for result in results:
+        if type(result) is Ok:
+            yield result._value  # noqa: SLF001
+
+
+def iter_errs(results: Iterable[Result[Value, Error]]) -> Iterator[Error]:
+    """Lazily iterate over errors of ``Err`` results, skipping success values."""
+    for result in results:
+        if type(result) is Err:
+            yield result._err  # noqa: SLF001
+
+
+def catch(*exceptions: type[Error]) -> Callable[[Callable[P, Any]], Callable[P, Any]]:
+    """Make function return result instead of raising given exceptions.
+
+    If no exception types were passed, any ``Exception`` will be converted to ``Err``.
+
+    Kind of decorated function is checked only once, on decoration:
+
+    * for regular functions wrapper returns ``Ok(return_value)`` or ``Err(exc)``. Arguments are
+      bound by function itself, so call with invalid arguments gives ``Err(TypeError(...))``,
+      if ``TypeError`` is caught;
+    * for generator functions wrapper yields ``Ok(item)`` for each item. If generator raises,
+      ``Err(exc)`` is yielded as last item;
+    * for coroutine functions ``async_catch`` is used.
+
+    Usage
+    -----
+
+    ```
+        @catch(KeyError, ValueError)
+        def parse(raw: dict[str, str]) -> int:
+            return int(raw["value"])
+
+        parse({"value": "1"})  # Ok(1)
+        parse({})  # Err(KeyError('value'))
+    ```
+    """
+    exc_types = exceptions or (Exception,)
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        if inspect.iscoroutinefunction(func):
+            return async_catch(*exc_types)(func)
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: P.args, **kwargs: P.kwargs) -> Iterator[Result[Any, Any]]:
+                try:
+                    for item in func(*args, **kwargs):
+                        yield Ok(item)
+                except exc_types as exc:
+                    yield Err(exc)
+
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[Any, Any]:
+            try:
+                return Ok(func(*args, **kwargs))
+            except exc_types as exc:
+                return Err(exc)
+
+        return wrapper
+
+    return decorator
+
+
+async def from_awaitable(
+    awaitable: Awaitable[Value],
+    *exceptions: type[Error],
+) -> Result[Value, Error]:
+    """Await given awaitable and wrap its outcome into result.
+
+    Only given exception types (or any ``Exception``, if no types were passed) are converted to
+    ``Err``. Other exceptions are propagated as is.
+    """
+    exc_types = exceptions or (Exception,)
+    try:
+        return Ok(await awaitable)
+    except exc_types as exc:
+        return Err(exc)  # type: ignore reportReturnType
+
+
+def async_catch(
+    *exceptions: type[Error],
+) -> Callable[
+    [Callable[P, Awaitable[Value]]],
+    Callable[P, Coroutine[None, None, Result[Value, Error]]],
+]:
+    """Make coroutine function return result instead of raising given exceptions.
+
+    If no exception types were passed, any ``Exception`` will be converted to ``Err``.
+
+    Usage
+    -----
+
+    ```
+        @async_catch(KeyError)
+        async def get_user(user_id: int) -> User:
+            ...
+
+        match await get_user(1):
+            case Ok(user):
+                ...
+            case Err(exc):
+                ...
+    ```
+    """
+    exc_types = exceptions or (Exception,)
+
+    def decorator(
+        func: Callable[P, Awaitable[Value]],
+    ) -> Callable[P, Coroutine[None, None, Result[Value, Error]]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[Value, Error]:
+            try:
+                return Ok(await func(*args, **kwargs))
+            except exc_types as exc:
+                return Err(exc)  # type: ignore reportReturnType
+
+        return wrapper
+
+    return decorator
+
+
+async def gather_results(
+    awaitables: Iterable[Awaitable[Value]],
+    *exceptions: type[Error],
+    limit: int | None = None,
+) -> list[Result[Value, Error]]:
+    """Run awaitables concurrently and return their results in input order.
+
+    At most ``limit`` awaitables are awaited at the same time (no limit by default). Failure of
+    one awaitable does not cancel others: it is stored as ``Err`` on its position. Only given
+    exception types (or any ``Exception``, if no types were passed) are converted to ``Err``.
+
+    Other exceptions are propagated, and already collected results are lost. Coroutines, that
+    were not started yet, are closed then, so they do not produce "never awaited" warnings.
+
+    Instead of task and semaphore per awaitable, only ``limit`` worker coroutines are created.
+    They take awaitables from one shared iterator and put results into preallocated list.
+    """
+    # NOTE: asyncio import is quite expensive, so it is done only when really needed.
+    import asyncio  # noqa: PLC0415
+
+    if limit is not None and limit < 1:
+        msg = f"limit must be positive integer or None, not {limit}."
+        raise ValueError(msg)
+    exc_types = exceptions or (Exception,)
+    pending = list(awaitables)
+    results: list[Result[Value, Error]] = [None] * len(pending)  # type: ignore reportAssignmentType
+    iterator = enumerate(pending)
+
+    async def _worker() -> None:
+        for index, awaitable in iterator:
+            try:
+                results[index] = Ok(await awaitable)
+            except exc_types as exc:
+                results[index] = Err(exc)  # type: ignore reportArgumentType
+            except BaseException:
+                for _, not_started in iterator:
+                    if isinstance(not_started, Coroutine):
+                        not_started.close()
+                raise
+
+    workers_count = len(results) if limit is None else min(limit, len(results))
+    if workers_count == 1:
+        await _worker()
+    elif workers_count > 1:
+        await asyncio.gather(*(_worker() for _ in range(workers_count)))
+    return results
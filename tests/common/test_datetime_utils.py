@@ -1,5 +1,7 @@
+import array
 import datetime
 import zoneinfo
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from freezegun import freeze_time
@@ -15,3 +17,174 @@ from tests.utils import generate_datetime_list
 def test_get_utc_now(dt: datetime.datetime) -> None:
     with freeze_time(dt):
         assert datetime_utils.get_utc_now() == dt
+
+
+class FakeTime:  # noqa: D101
+    def __init__(self) -> None:
+        self.monotonic = 100.0
+        self.wall = 1_700_000_000.0
+
+    def get_monotonic(self) -> float:  # noqa: D102
+        return self.monotonic
+
+    def get_wall(self) -> float:  # noqa: D102
+        return self.wall
+
+
+def test_coarse_utc_clock() -> None:
+    fake = FakeTime()
+    clock = datetime_utils.CoarseUTCClock(
+        0.5,
+        monotonic=fake.get_monotonic,
+        time_=fake.get_wall,
+    )
+    first = clock.now()
+    assert first == datetime.datetime.fromtimestamp(1_700_000_000.0, datetime.UTC)
+    fake.monotonic += 0.25
+    assert clock.now() is first
+    fake.monotonic += 0.25
+    second = clock.now()
+    assert second == datetime.datetime.fromtimestamp(1_700_000_000.5, datetime.UTC)
+    assert second is not first
+
+
+def test_coarse_utc_clock_resync() -> None:
+    fake = FakeTime()
+    clock = datetime_utils.CoarseUTCClock(
+        1,
+        resync_interval=10,
+        monotonic=fake.get_monotonic,
+        time_=fake.get_wall,
+    )
+    fake.monotonic += 5
+    fake.wall += 6  # wall clock was adjusted.
+    assert clock.now() == datetime.datetime.fromtimestamp(1_700_000_005.0, datetime.UTC)
+    fake.monotonic += 5
+    fake.wall += 5
+    assert clock.now() == datetime.datetime.fromtimestamp(1_700_000_011.0, datetime.UTC)
+
+
+def test_coarse_utc_clock_invalid_resolution() -> None:
+    with pytest.raises(ValueError, match="Resolution should be positive"):
+        datetime_utils.CoarseUTCClock(0)
+
+
+def test_coarse_utc_clock_real_time() -> None:
+    clock = datetime_utils.CoarseUTCClock(0.001)
+    before = datetime_utils.get_utc_now()
+    value = clock.now()
+    after = datetime_utils.get_utc_now()
+    tolerance = datetime.timedelta(milliseconds=50)
+    assert before - tolerance <= value <= after + tolerance
+    assert value.tzinfo is datetime.UTC
+
+
+def test_coarse_utc_clock_threads() -> None:
+    clock = datetime_utils.CoarseUTCClock(0.0001)
+
+    def collect() -> list[datetime.datetime]:
+        return [clock.now() for _ in range(10_000)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: collect(), range(4)))
+    for values in results:
+        assert values == sorted(values)
+
+
+@pytest.mark.parametrize(
+    "dt",
+    generate_datetime_list(n=3, tz=datetime.UTC),
+)
+def test_get_coarse_utc_now_frozen(dt: datetime.datetime) -> None:
+    clock = datetime_utils.FrozenUTCClock(dt)
+    with datetime_utils.use_utc_clock(clock):
+        assert datetime_utils.get_coarse_utc_now() == dt
+        clock.advance(datetime.timedelta(seconds=1))
+        assert datetime_utils.get_coarse_utc_now() == dt + datetime.timedelta(seconds=1)
+        clock.set(dt)
+        assert datetime_utils.get_coarse_utc_now() == dt
+    assert datetime_utils.get_coarse_utc_now() != dt
+
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [
+        datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.UTC),
+        datetime.datetime(1, 1, 1, tzinfo=datetime.UTC),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=zoneinfo.ZoneInfo("Europe/Moscow")),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 6),  # noqa: DTZ001
+        *generate_datetime_list(n=10, tz=datetime.UTC),
+    ],
+)
+def test_utc_iso_codec_format(dt: datetime.datetime) -> None:
+    codec = datetime_utils.UTCISOCodec()
+    assert codec.format(dt) == dt.isoformat()
+    assert codec.format(dt) == dt.isoformat()
+    assert codec.format_many([dt, dt]) == [dt.isoformat(), dt.isoformat()]
+
+
+@pytest.mark.parametrize(
+    "epoch",
+    [0, 1, -1, 1_700_000_000_000_000, 1_700_000_000_123_456, -62_135_596_800_000_000],
+)
+def test_utc_iso_codec_format_epoch_us(epoch: int) -> None:
+    codec = datetime_utils.UTCISOCodec()
+    expected = (EPOCH + epoch * MICROSECOND).isoformat()
+    assert codec.format_epoch_us(epoch) == expected
+    assert codec.format_epoch_us_many([epoch, epoch]) == [expected, expected]
+    assert codec.format_epoch_us_many(array.array("q", [epoch])) == [expected]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-01-02T03:04:05+00:00", 1_704_164_645_000_000),
+        ("2024-01-02T03:04:05.000006+00:00", 1_704_164_645_000_006),
+        ("2024-01-02T03:04:05.5Z", 1_704_164_645_500_000),
+        ("2024-01-02T06:04:05+03:00", 1_704_164_645_000_000),
+        ("2024-01-02 03:04:05", 1_704_164_645_000_000),
+        ("20240102T030405Z", 1_704_164_645_000_000),
+        ("1969-12-31T23:59:59.999999", -1),
+    ],
+)
+def test_utc_iso_codec_parse_epoch_us(value: str, expected: int) -> None:
+    codec = datetime_utils.UTCISOCodec()
+    assert codec.parse(value) == datetime.datetime.fromisoformat(value)
+    assert codec.parse_many([value]) == [datetime.datetime.fromisoformat(value)]
+    assert codec.parse_epoch_us(value) == expected
+    assert codec.parse_epoch_us_many([value, value]) == [expected, expected]
+
+
+def test_utc_iso_codec_parse_epoch_us_many_mixed_timezones() -> None:
+    codec = datetime_utils.UTCISOCodec()
+    values = ["2024-01-02T03:04:05+00:00", "2024-01-02T03:04:05", "2024-01-02T06:04:05+03:00"]
+    assert codec.parse_epoch_us_many(iter(values)) == [1_704_164_645_000_000] * 3
+
+
+def test_utc_iso_codec_round_trip() -> None:
+    codec = datetime_utils.UTCISOCodec(cache_size=2)
+    epochs = [1_700_000_000_000_000 + index * 370_000 for index in range(100)]
+    strings = codec.format_epoch_us_many(epochs)
+    assert strings == [codec.format_epoch_us(epoch) for epoch in epochs]
+    assert codec.parse_epoch_us_many(strings) == epochs
+    datetimes = codec.parse_many(strings)
+    assert codec.format_many(datetimes) == strings
+    codec.cache_clear()
+    assert codec.format_many(datetimes) == strings
+
+
+def test_utc_iso_codec_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    codec = datetime_utils.UTCISOCodec()
+    epochs = [0, 1_700_000_000_123_456]
+    expected = [(EPOCH + epoch * MICROSECOND).isoformat() for epoch in epochs]
+    assert codec.format_epoch_us_many(np.array(epochs, dtype=np.int64)) == expected
+    assert codec.format_epoch_us_many(np.array(epochs, dtype="datetime64[us]")) == expected
+    assert codec.format_epoch_us_many(np.array(["2023-11-14T22:13:20"], dtype="datetime64[s]")) == [
+        "2023-11-14T22:13:20+00:00",
+    ]
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 
 import pytest
 from mimesis import Datetime
@@ -104,3 +105,222 @@ def test_getenv_bool_default(default: str, expected_result: bool) -> None:  # no
     if DEFAULT_KEY in os.environ:
         del os.environ[DEFAULT_KEY]
     assert env_utils.getenv_bool(DEFAULT_KEY, default=default) == expected_result
+
+
+def test_env_snapshot_captures_environ_once() -> None:
+    os.environ[DEFAULT_KEY] = "1"
+    snapshot = env_utils.EnvSnapshot()
+    os.environ[DEFAULT_KEY] = "0"
+    assert snapshot.get_bool(DEFAULT_KEY) is True
+    assert snapshot.get_str(DEFAULT_KEY) == "1"
+    snapshot.refresh()
+    assert snapshot.get_bool(DEFAULT_KEY) is False
+    assert snapshot.get_str(DEFAULT_KEY) == "0"
+
+
+def test_env_snapshot_live() -> None:
+    os.environ[DEFAULT_KEY] = "1"
+    snapshot = env_utils.EnvSnapshot(live=True)
+    assert snapshot.get_int(DEFAULT_KEY) == 1
+    os.environ[DEFAULT_KEY] = "2"
+    assert snapshot.get_int(DEFAULT_KEY) == 2  # noqa: PLR2004
+
+
+def test_getenv_sees_rebound_environ(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(os, "environ", {DEFAULT_KEY: "5"})
+    assert env_utils.getenv_int(DEFAULT_KEY) == 5  # noqa: PLR2004
+    assert env_utils.getenv_bool(DEFAULT_KEY) is False
+    assert env_utils.getenv_list(DEFAULT_KEY) == ["5"]
+    monkeypatch.setattr(os, "environ", {DEFAULT_KEY: "t"})
+    assert env_utils.getenv_bool(DEFAULT_KEY) is True
+
+
+@pytest.mark.parametrize(
+    ("environ", "expected_result"),
+    [
+        ({DEFAULT_KEY: "a,b"}, (["a", "b"], False, None)),
+        ({DEFAULT_KEY: "yes"}, (["yes"], True, None)),
+        ({DEFAULT_KEY: "12.5"}, ([], False, 12)),
+        ({}, ([], False, None)),
+    ],
+)
+def test_env_snapshot_typed_getters(
+    environ: dict[str, str],
+    expected_result: tuple[list[str], bool, int | None],
+) -> None:
+    snapshot = env_utils.EnvSnapshot(environ)
+    for _ in range(2):
+        assert (
+            snapshot.get_list(DEFAULT_KEY),
+            snapshot.get_bool(DEFAULT_KEY),
+            snapshot.get_int(DEFAULT_KEY),
+        ) == expected_result
+
+
+def test_env_snapshot_defaults_are_part_of_cache_key() -> None:
+    snapshot = env_utils.EnvSnapshot({})
+    assert snapshot.get_int(DEFAULT_KEY, default=1) == 1
+    assert snapshot.get_int(DEFAULT_KEY, default=2) == 2  # noqa: PLR2004
+    assert snapshot.get_bool(DEFAULT_KEY, default="yes") is True
+    assert snapshot.get_bool(DEFAULT_KEY) is False
+    assert snapshot.get_list(DEFAULT_KEY, default="a.b", separator=".") == ["a", "b"]
+    assert snapshot.get_list(DEFAULT_KEY, default="a.b") == []
+
+
+def test_env_snapshot_list_is_not_shared() -> None:
+    snapshot = env_utils.EnvSnapshot({DEFAULT_KEY: "a,b"})
+    snapshot.get_list(DEFAULT_KEY).append("c")
+    assert snapshot.get_list(DEFAULT_KEY) == ["a", "b"]
+
+
+CONFIG_SPEC: dict[str, env_utils.EnvField | type] = {
+    "debug": bool,
+    "name": str,
+    "port": env_utils.EnvField(int, 8000),
+    "ratio": env_utils.EnvField(float, 0.5),
+    "hosts": env_utils.EnvField(list, [], separator=";"),
+    "secret": env_utils.EnvField(str, env_name="SOME_SECRET"),
+}
+
+
+@pytest.mark.parametrize(
+    ("environ", "expected_result"),
+    [
+        (
+            {"APP_DEBUG": "yes", "APP_NAME": "abc", "SOME_SECRET": "xyz"},
+            {
+                "debug": True,
+                "name": "abc",
+                "port": 8000,
+                "ratio": 0.5,
+                "hosts": [],
+                "secret": "xyz",
+            },
+        ),
+        (
+            {
+                "APP_DEBUG": "0",
+                "APP_NAME": "abc",
+                "APP_PORT": "80.0",
+                "APP_RATIO": "1.5",
+                "APP_HOSTS": "a; b;",
+                "SOME_SECRET": "xyz",
+            },
+            {
+                "debug": False,
+                "name": "abc",
+                "port": 80,
+                "ratio": 1.5,
+                "hosts": ["a", "b"],
+                "secret": "xyz",
+            },
+        ),
+    ],
+)
+def test_env_config_loader(environ: dict[str, str], expected_result: dict[str, object]) -> None:
+    loader = env_utils.EnvConfigLoader(CONFIG_SPEC, prefix="app_")
+    assert loader.load(environ) == expected_result
+
+
+def test_env_config_loader_reports_all_errors() -> None:
+    loader = env_utils.EnvConfigLoader(CONFIG_SPEC, prefix="app_")
+    with pytest.raises(env_utils.EnvConfigError) as exc_info:
+        loader.load({"APP_NAME": "abc", "APP_PORT": "abc", "APP_RATIO": "inf?"})
+    assert set(exc_info.value.errors) == {"APP_DEBUG", "APP_PORT", "APP_RATIO", "SOME_SECRET"}
+
+
+def test_env_config_loader_reads_os_environ() -> None:
+    os.environ[DEFAULT_KEY] = "15"
+    loader = env_utils.EnvConfigLoader({"value": env_utils.EnvField(int, env_name=DEFAULT_KEY)})
+    assert loader.load() == {"value": 15}
+
+
+def test_env_config_loader_default_list_is_not_shared() -> None:
+    loader = env_utils.EnvConfigLoader({"hosts": env_utils.EnvField(list, ["a"])})
+    loader.load({})["hosts"].append("b")
+    assert loader.load({}) == {"hosts": ["a"]}
+
+
+def test_env_field_unsupported_type() -> None:
+    with pytest.raises(TypeError):
+        env_utils.EnvField(dict)
+
+
+DOTENV_CONTENT = (
+    "# comment line\n"
+    "\n"
+    "export EXPORTED=1\n"
+    "BARE = hello world   # trailing comment\n"
+    "SINGLE='single # not a comment' # comment\n"
+    'DOUBLE="multi\nline \\"quoted\\"\\ttab"\n'
+    "HASH=a#b\n"
+    "EMPTY=\n"
+    "  INDENTED=value\n"
+    "not a valid line\n"
+    "CRLF=value\r\n"
+)
+
+
+@pytest.fixture
+def dotenv_path(tmp_path: Path) -> Path:
+    path = tmp_path / ".env"
+    path.write_bytes(DOTENV_CONTENT.encode())
+    return path
+
+
+def test_parse_dotenv(dotenv_path: Path) -> None:
+    assert env_utils.parse_dotenv(dotenv_path) == {
+        "EXPORTED": "1",
+        "BARE": "hello world",
+        "SINGLE": "single # not a comment",
+        "DOUBLE": 'multi\nline "quoted"\ttab',
+        "HASH": "a#b",
+        "EMPTY": "",
+        "INDENTED": "value",
+        "CRLF": "value",
+    }
+
+
+def test_parse_dotenv_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / ".env"
+    path.touch()
+    assert env_utils.parse_dotenv(path) == {}
+
+
+@pytest.mark.skipif(not Path("/dev/fd").is_dir(), reason="/dev/fd is not available")
+def test_parse_dotenv_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, DOTENV_CONTENT.encode())
+        os.close(write_fd)
+        assert env_utils.parse_dotenv(f"/dev/fd/{read_fd}")["BARE"] == "hello world"
+    finally:
+        os.close(read_fd)
+
+
+def test_load_dotenv(dotenv_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # NOTE: loaded variables should not leak into other tests.
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    monkeypatch.setenv("EXPORTED", "already set")
+    assert env_utils.load_dotenv(dotenv_path)["EXPORTED"] == "1"
+    assert os.environ["EXPORTED"] == "already set"
+    assert os.environ["HASH"] == "a#b"
+    env_utils.load_dotenv(dotenv_path, override=True)
+    assert os.environ["EXPORTED"] == "1"
+
+
+@pytest.mark.parametrize(
+    ("override", "expected_result"),
+    [(False, "already set"), (True, "1")],
+)
+def test_env_snapshot_from_dotenv(
+    dotenv_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    override: bool,  # noqa: FBT001
+    expected_result: str,
+) -> None:
+    monkeypatch.setenv("EXPORTED", "already set")
+    snapshot = env_utils.EnvSnapshot.from_dotenv(dotenv_path, override=override)
+    assert snapshot.get_str("EXPORTED") == expected_result
+    assert snapshot.get_list("BARE", separator=" ") == ["hello", "world"]
+    assert "HASH" not in os.environ
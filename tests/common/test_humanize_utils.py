@@ -1,3 +1,6 @@
+import array
+from collections.abc import Iterator
+
 import pytest
 
 from dev_utils.common import humanize as humanize_utils
@@ -51,3 +54,100 @@ def test_sizeof_fmt_suffix(suffix: str, expected_result: str) -> None:
 )
 def test_sizeof_fmt_with_force_float(size: float, suffix: str, expected_result: str) -> None:
     assert humanize_utils.sizeof_fmt(size, suffix=suffix, force_float=True) == expected_result
+
+
+SIZES = [
+    *(1024**power + delta for power in range(10) for delta in (-1, 0, 1)),
+    *(-(1024**power) - delta for power in range(10) for delta in (-1, 0, 1)),
+    *(1024**power * factor for power in range(10) for factor in (0.5, 1.5, 1023.95, 1023.96)),
+    0,
+    0.04,
+    2**60 - 1,
+]
+
+
+@pytest.mark.parametrize("force_float", [True, False])
+@pytest.mark.parametrize("suffix", ["b", "ib"])
+def test_sizeof_fmt_many(suffix: str, force_float: bool) -> None:  # noqa: FBT001
+    expected_result = [
+        humanize_utils.sizeof_fmt(size, suffix=suffix, force_float=force_float) for size in SIZES
+    ]
+    assert (
+        humanize_utils.sizeof_fmt_many(SIZES, suffix=suffix, force_float=force_float)
+        == expected_result
+    )
+    assert (
+        humanize_utils.sizeof_fmt_many(iter(SIZES), suffix=suffix, force_float=force_float)
+        == expected_result
+    )
+
+
+@pytest.mark.parametrize("typecode", ["q", "d"])
+def test_sizeof_fmt_many_array(typecode: str) -> None:
+    sizes = array.array(
+        typecode,
+        [
+            size
+            for size in SIZES
+            if abs(size) < 2**62 and (typecode == "d" or isinstance(size, int))
+        ],
+    )
+    assert humanize_utils.sizeof_fmt_many(sizes) == [
+        humanize_utils.sizeof_fmt(size) for size in sizes
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["int64", "float64"])
+def test_sizeof_fmt_many_numpy(dtype: str) -> None:
+    np = pytest.importorskip("numpy")
+    sizes = np.array([size for size in SIZES if abs(size) < 2**62], dtype=dtype)
+    assert humanize_utils.sizeof_fmt_many(sizes) == [
+        humanize_utils.sizeof_fmt(size) for size in sizes.tolist()
+    ]
+
+
+def test_sizeof_fmt_many_nan() -> None:
+    with pytest.raises(ValueError, match="NaN"):
+        humanize_utils.sizeof_fmt(float("nan"))
+    with pytest.raises(ValueError, match="NaN"):
+        humanize_utils.sizeof_fmt_many([float("nan")])
+
+
+@pytest.mark.parametrize(
+    ("value", "suffix", "expected_result"),
+    [
+        ("1023b", "b", 1023),
+        ("1Kb", "b", 1024),
+        ("1.5Gb", "b", int(1.5 * 1024**3)),
+        ("512K", "b", 512 * 1024),
+        ("100", "b", 100),
+        (" 2 mb ", "b", 2 * 1024**2),
+        (".5K", "b", 512),
+        ("-1Kb", "b", -1024),
+        ("1Yb", "b", 1024**8),
+        ("1.0Kib", "ib", 1024),
+        ("1Kabc", "abc", 1024),
+    ],
+)
+def test_parse_size(value: str, suffix: str, expected_result: int) -> None:
+    assert humanize_utils.parse_size(value, suffix=suffix) == expected_result
+
+
+@pytest.mark.parametrize("value", ["", "abc", "1Q", "1 Kbb", "1..2K", "K"])
+def test_parse_size_invalid(value: str) -> None:
+    with pytest.raises(ValueError, match="Invalid size"):
+        humanize_utils.parse_size(value)
+
+
+def test_parse_sizes_roundtrip() -> None:
+    sizes = [0, 1, 1023, *(1024**power for power in range(9))]
+    result = humanize_utils.parse_sizes(iter(humanize_utils.sizeof_fmt_many(sizes)))
+    assert isinstance(result, Iterator)
+    assert list(result) == sizes
+
+
+def test_parse_sizes_invalid() -> None:
+    result = humanize_utils.parse_sizes(["1Kb", "abc"])
+    assert next(result) == 1024  # noqa: PLR2004
+    with pytest.raises(ValueError, match="Invalid size"):
+        next(result)
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import dev_utils
+from dev_utils import common
+
+IMPORT_TIME_BUDGET_US = 5_000
+ROOT = Path(dev_utils.__file__).parents[1]
+
+
+def _run(*args: str) -> str:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        text=True,
+    )
+    return completed.stdout + completed.stderr
+
+
+def _import_self_times(statement: str) -> dict[str, int]:
+    times: dict[str, int] = {}
+    for line in _run("-X", "importtime", "-c", statement).splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        if self_time.strip().isdigit():
+            times[name.strip()] = int(self_time)
+    return times
+
+
+def test_lazy_names() -> None:
+    for name in common.__all__:
+        assert getattr(common, name) is not None
+        assert name in dir(common)
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        common.unknown  # type: ignore reportAttributeAccessIssue  # noqa: B018
+
+
+def test_submodules_are_imported_lazily() -> None:
+    output = _run(
+        "-c",
+        "import sys\n"
+        "import dev_utils.common\n"
+        "print(sorted(name for name in sys.modules if name.startswith('dev_utils.common.')))\n"
+        "dev_utils.common.sizeof_fmt\n"
+        "print(sorted(name for name in sys.modules if name.startswith('dev_utils.common.')))\n",
+    )
+    assert output.splitlines() == ["[]", "['dev_utils.common.humanize']"]
+
+
+def test_import_time_budget() -> None:
+    # NOTE: typing is imported by almost any module, so modules, that it imports, are not
+    # counted. Best of few runs is taken to avoid flakiness on loaded machines.
+    typing_modules = _import_self_times("import typing").keys()
+    own_time = min(
+        sum(
+            value
+            for name, value in _import_self_times("import dev_utils.common").items()
+            if name not in typing_modules
+        )
+        for _ in range(3)
+    )
+    assert own_time < IMPORT_TIME_BUDGET_US
@@ -1,6 +1,10 @@
+import gc
+import weakref
+
 import pytest
 
 from dev_utils.common import inspect
+from dev_utils.results import Err, Ok
 
 obj = object()
 
@@ -19,3 +23,95 @@ class MyObject:  # noqa: D101
 )
 def test_get_object_class_absolute_name(obj: object, expected_result: str) -> None:
     assert inspect.get_object_class_absolute_name(obj) == expected_result
+
+
+def test_get_object_class_absolute_name_cached() -> None:
+    first = inspect.get_object_class_absolute_name(MyObject())
+    assert inspect.get_object_class_absolute_name(MyObject()) is first
+
+
+def test_get_object_class_absolute_name_does_not_keep_classes() -> None:
+    temporary_class = type("TemporaryClass", (), {})
+    class_ref = weakref.ref(temporary_class)
+    assert (
+        inspect.get_object_class_absolute_name(temporary_class())
+        == "tests.common.test_inspect_utils.TemporaryClass"
+    )
+    cache_size = len(inspect._class_names)  # noqa: SLF001
+    del temporary_class
+    gc.collect()
+    assert class_ref() is None
+    assert len(inspect._class_names) == cache_size - 1  # noqa: SLF001
+
+
+def test_get_objects_class_absolute_names() -> None:
+    objects = [obj, MyObject, MyObject(), 1, int, "a"]
+    assert inspect.get_objects_class_absolute_names(iter(objects)) == [
+        inspect.get_object_class_absolute_name(item) for item in objects
+    ]
+
+
+class EqMeta(type):  # noqa: D101
+    def __eq__(cls, other: object) -> bool:  # noqa: D105
+        return cls is other
+
+
+class UnhashableClass(metaclass=EqMeta):  # noqa: D101
+    pass
+
+
+def test_get_object_class_absolute_name_unhashable_class() -> None:
+    expected_result = "tests.common.test_inspect_utils.UnhashableClass"
+    assert inspect.get_object_class_absolute_name(UnhashableClass) == expected_result
+    assert inspect.get_object_class_absolute_name(UnhashableClass()) == expected_result
+    assert inspect.get_objects_class_absolute_names([UnhashableClass(), 1]) == [
+        expected_result,
+        "int",
+    ]
+
+
+class Outer:  # noqa: D101
+    class Inner:  # noqa: D106
+        pass
+
+
+@pytest.mark.parametrize(
+    ("name", "expected_result"),
+    [
+        ("object", object),
+        ("tests.common.test_inspect_utils.MyObject", MyObject),
+        ("tests.common.test_inspect_utils.Outer.Inner", Outer.Inner),
+        ("dev_utils.common.inspect", inspect),
+        ("os.path.join", __import__("os").path.join),
+    ],
+)
+def test_resolve_absolute_name(name: str, expected_result: object) -> None:
+    result = inspect.resolve_absolute_name(name)
+    assert isinstance(result, Ok)
+    assert result.unwrap() is expected_result
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "",
+        "tests..MyObject",
+        "not_existing_module.MyObject",
+        "tests.common.test_inspect_utils.NotExisting",
+        "tests.common.test_inspect_utils.Outer.Inner.NotExisting",
+    ],
+)
+def test_resolve_absolute_name_error(name: str) -> None:
+    result = inspect.resolve_absolute_name(name)
+    assert isinstance(result, Err)
+    assert isinstance(result.err(), ImportError)
+
+
+def test_resolve_absolute_name_round_trip() -> None:
+    name = inspect.get_object_class_absolute_name(Outer.Inner())
+    assert inspect.resolve_absolute_name(name).unwrap() is Outer.Inner
+
+
+def test_resolve_absolute_name_cached() -> None:
+    first = inspect.resolve_absolute_name("tests.common.test_inspect_utils.MyObject")
+    assert inspect.resolve_absolute_name("tests.common.test_inspect_utils.MyObject") is first
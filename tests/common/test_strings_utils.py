@@ -1,3 +1,6 @@
+import io
+from collections.abc import Iterator
+
 import pytest
 
 from dev_utils.common import strings as strings_utils
@@ -10,12 +13,39 @@ from dev_utils.common import strings as strings_utils
         ("                 abc\nabc                ", "abc abc"),
         ("                 abc  abc                ", "abc abc"),
         ("                 abc   abc                ", "abc abc"),
+        ("abc \n abc", "abc abc"),
+        ("abc\n\nabc", "abc abc"),
+        ("\n abc\tabc \n", "abc\tabc"),
+        ("", ""),
     ],
 )
 def test_trim_and_plain_text(obj: str, expected_result: str) -> None:
     assert strings_utils.trim_and_plain_text(obj) == expected_result
 
 
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["   abc  ", "  \n  abc", "   "],
+        ["", "  ", "\n"],
+        ["a", "b", " ", "\n", "c"],
+        ["abc\n", "\nabc\t", " \t"],
+    ],
+)
+def test_iter_trim_and_plain_text(chunks: list[str]) -> None:
+    expected_result = strings_utils.trim_and_plain_text("".join(chunks))
+    result = strings_utils.iter_trim_and_plain_text(iter(chunks))
+    assert isinstance(result, Iterator)
+    assert "".join(result) == expected_result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+def test_iter_trim_and_plain_text_file(chunk_size: int) -> None:
+    text = "  some   long\n\n text  with \n many   spaces  \n"
+    result = strings_utils.iter_trim_and_plain_text(io.StringIO(text), chunk_size=chunk_size)
+    assert "".join(result) == "some long text with many spaces"
+
+
 @pytest.mark.parametrize(
     ("string", "expected_result"),
     [
@@ -42,3 +72,74 @@ def test_trim_and_plain_text(obj: str, expected_result: str) -> None:
 )
 def test(string: str, expected_result: str) -> None:
     assert strings_utils.has_format_brackets(string) is expected_result
+
+
+TEXTS = [
+    "  Product title  ",
+    "Product\ntitle",
+    "Product title",
+    "Another   product",
+    "  Product title  ",
+    "",
+]
+
+
+def test_trim_and_plain_text_many() -> None:
+    assert strings_utils.trim_and_plain_text_many(iter(TEXTS)) == [
+        strings_utils.trim_and_plain_text(text) for text in TEXTS
+    ]
+
+
+def test_plain_text_normalizer_cache() -> None:
+    normalizer = strings_utils.PlainTextNormalizer(cache_size=2)
+    assert normalizer.normalize("  a  b ") == "a b"
+    assert normalizer.normalize_many(["a", "a", "  a  b "]) == ["a", "a", "a b"]
+    info = normalizer.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 2, 2, 2)
+    normalizer.cache_clear()
+    assert normalizer.cache_info().currsize == 0
+
+
+def test_plain_text_normalizer_processes() -> None:
+    normalizer = strings_utils.PlainTextNormalizer()
+    assert normalizer.normalize_many(iter(TEXTS), processes=2, chunksize=2) == [
+        strings_utils.trim_and_plain_text(text) for text in TEXTS
+    ]
+    assert normalizer.cache_info().misses == 0
+
+
+@pytest.mark.parametrize(
+    ("template", "args", "kwargs", "expected_fields", "expected_result"),
+    [
+        ("plain text", (), {}, (), "plain text"),
+        ("{} and {}", (1, 2), {}, ("",), "1 and 2"),
+        ("{1} and {0}", (1, 2), {}, ("1", "0"), "2 and 1"),
+        ("{{escaped}} {value}", (), {"value": 1}, ("value",), "{escaped} 1"),
+        ("{value!r:>{width}}", (), {"value": "a", "width": 5}, ("value", "width"), "  'a'"),
+        ("{obj.real} {items[0]}", (), {"obj": 1, "items": [2]}, ("obj", "items"), "1 2"),
+    ],
+)
+def test_compile_template(
+    template: str,
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+    expected_fields: tuple[str, ...],
+    expected_result: str,
+) -> None:
+    compiled = strings_utils.compile_template(template)
+    assert compiled.fields == expected_fields
+    assert compiled.render(*args, **kwargs) == expected_result
+    if not args:
+        assert compiled.render_map(kwargs) == expected_result
+
+
+@pytest.mark.parametrize("template", ["{", "}", "{!}", "{a!x}", "{}{0}", "{a:{b:{c}}}"])
+def test_compile_template_invalid(template: str) -> None:
+    with pytest.raises(ValueError, match="Invalid format template"):
+        strings_utils.compile_template(template)
+
+
+def test_compile_template_cache() -> None:
+    strings_utils.compile_template.cache_clear()
+    assert strings_utils.compile_template("{a}") is strings_utils.compile_template("{a}")
+    assert strings_utils.compile_template.cache_info().hits == 1
@@ -1,4 +1,5 @@
 from abc import ABC
+from collections.abc import Iterator
 
 import pytest
 
@@ -63,3 +64,141 @@ def test_inherit_abstract_skip() -> None:
 
     class InheritClass(CorrectClass):  # type: ignore reportUnusedClass
         __skip_abstract_raise_error__ = True
+
+
+def test_abstract_class_properties_registry() -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+        b: int = abstract.abstract_class_property(int)
+        c = 1
+
+    class Concrete(Base):  # type: ignore reportUnusedClass
+        a = "a"
+        b = 1
+
+    class Child(Concrete):  # type: ignore reportUnusedClass
+        pass
+
+    assert Base.__abstract_class_properties__ == frozenset({"a", "b"})
+    assert Concrete.__abstract_class_properties__ == frozenset()
+    assert Child.__abstract_class_properties__ == frozenset()
+
+
+def test_abstract_class_properties_registry_multiple_inheritance() -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+
+    class Mixin:
+        a = "a"
+
+    class Concrete(Mixin, Base):  # type: ignore reportUnusedClass
+        pass
+
+    assert Concrete.__abstract_class_properties__ == frozenset()
+    with pytest.raises(TypeError, match="must define abstract class property a"):
+
+        class InvalidConcrete(Base, Mixin):  # type: ignore reportUnusedClass
+            pass
+
+
+def test_abstract_class_properties_registry_skip() -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+        b: str = abstract.abstract_class_property(str)
+
+    class Partial(Base):  # type: ignore reportUnusedClass
+        __skip_abstract_raise_error__ = True
+        a = "a"
+
+    assert Partial.__abstract_class_properties__ == frozenset({"b"})
+    with pytest.raises(TypeError, match="must define abstract class property b"):
+
+        class InvalidConcrete(Partial):  # type: ignore reportUnusedClass
+            pass
+
+
+@pytest.fixture
+def _deferred_validation(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv(abstract.DEFERRED_VALIDATION_ENV, "true")
+    yield
+    abstract._pending_classes.clear()  # type: ignore reportPrivateUsage  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("_deferred_validation")
+def test_deferred_validation_explicit() -> None:
+    class ClassWithoutProperties(abstract.Abstract):  # type: ignore reportUnusedClass
+        pass
+
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+
+    class InvalidClass(Base):  # type: ignore reportUnusedClass
+        pass
+
+    with (
+        pytest.warns(abstract.AbstractClassWithoutAbstractPropertiesWarning),
+        pytest.raises(TypeError, match="InvalidClass must define abstract class property a"),
+    ):
+        abstract.validate_abstract_classes()
+    abstract.validate_abstract_classes()
+
+
+@pytest.mark.usefixtures("_deferred_validation")
+def test_deferred_validation_on_instantiation() -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+
+    class InvalidClass(Base):  # type: ignore reportUnusedClass
+        pass
+
+    class ValidClass(Base):  # type: ignore reportUnusedClass
+        a = "a"
+
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    with pytest.raises(TypeError, match="InvalidClass must define abstract class property a"):
+        ValidClass(1)
+    assert ValidClass(2).value == 2  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("_deferred_validation")
+def test_eager_subclass_of_deferred_base(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+
+    monkeypatch.delenv(abstract.DEFERRED_VALIDATION_ENV)
+
+    class InvalidClass(Base):  # type: ignore reportUnusedClass
+        pass
+
+    with pytest.raises(TypeError, match="InvalidClass must define abstract class property a"):
+        abstract.validate_abstract_classes()
+    assert InvalidClass.__abstract_class_properties__ == frozenset({"a"})
+
+
+@pytest.mark.usefixtures("_deferred_validation")
+def test_deferred_validation_rejects_arguments_without_init() -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+
+    class ValidClass(Base):  # type: ignore reportUnusedClass
+        a = "a"
+
+    with pytest.raises(TypeError, match=r"ValidClass\(\) takes no arguments"):
+        ValidClass(1, 2)  # type: ignore reportCallIssue
+    with pytest.raises(TypeError, match=r"ValidClass\(\) takes no arguments"):
+        ValidClass(value=1)  # type: ignore reportCallIssue
+    assert isinstance(ValidClass(), ValidClass)
+
+
+@pytest.mark.usefixtures("_deferred_validation")
+def test_deferred_validation_with_other_new() -> None:
+    class Base(abstract.Abstract):  # type: ignore reportUnusedClass
+        a: str = abstract.abstract_class_property(str)
+
+    class StrClass(Base, str):  # type: ignore reportUnusedClass
+        __slots__ = ()
+        a = "a"
+
+    assert StrClass("value") == "value"
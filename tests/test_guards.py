@@ -1,5 +1,6 @@
-from collections.abc import Sequence
-from typing import Any
+import array
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Annotated, Any, Literal, NewType, NotRequired, TypedDict
 
 import pytest
 
@@ -36,3 +37,226 @@ def test_all_elements_in_sequence_are_str(
     expected_result: bool,  # noqa: FBT001
 ) -> None:
     assert guards.all_elements_in_sequence_are_str(seq) is expected_result
+
+
+class User(TypedDict):  # noqa: D101
+    id: int
+    name: str
+    tags: NotRequired[list[str]]
+
+
+class Tree(TypedDict):  # noqa: D101
+    value: int
+    children: "list[Tree]"
+
+
+UserId = NewType("UserId", int)
+
+
+@pytest.mark.parametrize(
+    ("hint", "value", "expected_result"),
+    [
+        (int, 1, True),
+        (int, "1", False),
+        (float, 1, True),
+        (Any, object(), True),
+        (None, None, True),
+        (int | None, None, True),
+        (int | str, 1.5, False),
+        (Literal["a", 1], 1, True),
+        (Literal["a", 1], True, False),
+        (Annotated[int, "meta"], 1, True),
+        (UserId, 1, True),
+        (list, [1, "a"], True),
+        (list[int], [1, 2, 3], True),
+        (list[int], [1, "2", 3], False),
+        (list[int], (1, 2, 3), False),
+        (list[list[int] | str], [[1], "a"], True),
+        (list[list[int] | str], [[1], 2], False),
+        (tuple[int, ...], (1, 2), True),
+        (tuple[int, str], (1, "a"), True),
+        (tuple[int, str], (1,), False),
+        (Sequence[int], "ab", False),
+        (Iterable[int], [1, 2], True),
+        (Iterable[int], iter([1, 2]), False),
+        (dict[str, list[int]], {"a": [1, 2], "b": []}, True),
+        (dict[str, list[int]], {"a": [1, "2"]}, False),
+        (dict[str, list[int]], {1: [1]}, False),
+        (Mapping[str, int], {"a": 1}, True),
+        (User, {"id": 1, "name": "user"}, True),
+        (User, {"id": 1, "name": "user", "tags": ["a"]}, True),
+        (User, {"id": 1}, False),
+        (User, {"id": 1, "name": "user", "tags": [1]}, False),
+        (list[User], [{"id": 1, "name": "user"}, {"id": "2", "name": "user"}], False),
+        (Tree, {"value": 1, "children": [{"value": 2, "children": []}]}, True),
+        (Tree, {"value": 1, "children": [{"value": "2", "children": []}]}, False),
+    ],
+)
+def test_compile_guard(
+    hint: Any,  # noqa: ANN401
+    value: Any,  # noqa: ANN401
+    expected_result: bool,  # noqa: FBT001
+) -> None:
+    assert guards.compile_guard(hint)(value) is expected_result
+    assert (guards.find_type_errors(hint, value) == []) is expected_result
+
+
+def test_compile_guard_cached() -> None:
+    assert guards.compile_guard(dict[str, list[int]]) is guards.compile_guard(dict[str, list[int]])
+
+
+def test_compile_guard_not_supported() -> None:
+    with pytest.raises(TypeError, match="is not supported"):
+        guards.compile_guard(list["int"])
+
+
+def test_compile_guard_does_not_consume_iterator() -> None:
+    values = iter([1, 2, 3])
+    assert guards.compile_guard(Iterable[int])(values) is False
+    assert list(values) == [1, 2, 3]
+
+
+def test_find_type_errors() -> None:
+    assert guards.find_type_errors(list[User], [{"id": "1"}, {"id": 2, "name": "user"}]) == [
+        "$[0]: missing key 'name'",
+        "$[0]['id']: expected int, got str",
+    ]
+    assert guards.find_type_errors(dict[str, list[int]], {"a": [1, "2"], 3: []}) == [
+        "$['a'][1]: expected int, got str",
+        "$[3] (key): expected str, got int",
+    ]
+    assert guards.find_type_errors(Tree, {"value": 1, "children": [{"value": 2}]}) == [
+        "$['children'][0]: missing key 'children'",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("value", "type_", "expected_result"),
+    [
+        ("abc", str, True),
+        (b"abc", int, True),
+        (b"abc", str, False),
+        (array.array("u", "abc"), str, True),
+        (array.array("i", [1, 2]), int, True),
+        (array.array("i", [1, 2]), str, False),
+        (array.array("d", [1.5]), float, True),
+        (array.array("d"), str, True),
+        (memoryview(b"abc"), int, True),
+        (memoryview(b"abc").cast("c"), bytes, True),
+        (memoryview(array.array("d", [1.5])), float, True),
+        (memoryview(array.array("d", [1.5])), int, False),
+        ([1, 2, 3], int, True),
+        ([1, "2", 3], int, False),
+        ({1, 2}, int, True),
+    ],
+)
+def test_all_elements_are(
+    value: Any,  # noqa: ANN401
+    type_: type,
+    expected_result: bool,  # noqa: FBT001
+) -> None:
+    assert guards.all_elements_are(value, type_) is expected_result
+    assert all(isinstance(element, type_) for element in value) is expected_result
+
+
+@pytest.mark.parametrize(
+    ("dtype", "type_", "expected_result"),
+    [
+        ("float64", float, True),
+        ("int64", int, False),
+        ("str", str, True),
+        ("object", int, True),
+    ],
+)
+def test_all_elements_are_numpy(
+    dtype: str,
+    type_: type,
+    expected_result: bool,  # noqa: FBT001
+) -> None:
+    np = pytest.importorskip("numpy")
+    value = np.array([1, 2, 3], dtype=dtype)
+    assert guards.all_elements_are(value, type_) is expected_result
+    assert all(isinstance(element, type_) for element in value) is expected_result
+    assert guards.all_elements_are(value.reshape(1, 3), type_) is False
+
+
+def test_all_elements_are_sample_size() -> None:
+    value = [*range(1001), "invalid", *range(1000)]
+    assert guards.all_elements_are(value, int) is False
+    assert guards.all_elements_are(value, int, sample_size=10) is True
+    assert guards.all_elements_are([*range(1000), "invalid"], int, sample_size=10) is False
+    assert guards.all_elements_are(["invalid", *range(1000)], int, sample_size=10) is False
+
+
+@pytest.mark.parametrize("sample_size", [0, -1])
+def test_all_elements_are_invalid_sample_size(sample_size: int) -> None:
+    with pytest.raises(ValueError, match="sample_size must be positive"):
+        guards.all_elements_are(list(range(100)), int, sample_size=sample_size)
+
+
+def test_all_elements_in_sequence_are_int_and_float() -> None:
+    assert guards.all_elements_in_sequence_are_int(array.array("q", [1, 2])) is True
+    assert guards.all_elements_in_sequence_are_int([1, 2.5]) is False
+    assert guards.all_elements_in_sequence_are_float(array.array("d", [1.5])) is True
+    assert guards.all_elements_in_sequence_are_float([1.5, "2"]) is False
+
+
+def test_str_key_dict() -> None:
+    value = guards.StrKeyDict({"a": 1}, b=2)
+    value["c"] = 3
+    value.update({"d": 4}, e=5)
+    value |= {"f": 6}
+    value.setdefault("g", 7)
+    assert value == {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6, "g": 7}
+    assert isinstance(value.copy(), guards.StrKeyDict)
+    assert guards.all_dict_keys_are_str(value) is True
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda value: guards.StrKeyDict({1: 1}),  # noqa: ARG005
+        lambda value: value.__setitem__(1, 1),
+        lambda value: value.update({1: 1}),
+        lambda value: value.update([(1, 1)]),
+        lambda value: value.__ior__({1: 1}),
+        lambda value: value.setdefault(1, 1),
+    ],
+)
+def test_str_key_dict_invalid_key(operation: Callable[[guards.StrKeyDict[int]], Any]) -> None:
+    value = guards.StrKeyDict({"a": 1})
+    with pytest.raises(TypeError, match="Key 1 is not a string"):
+        operation(value)
+    assert value == {"a": 1}
+
+
+def test_str_list() -> None:
+    value = guards.StrList(["a"])
+    value.append("b")
+    value.insert(0, "c")
+    value.extend(["d"])
+    value += ["e"]
+    value[0] = "f"
+    value[1:2] = ["g", "h"]
+    assert value == ["f", "g", "h", "b", "d", "e"]
+    assert isinstance(value.copy(), guards.StrList)
+    assert guards.all_elements_in_sequence_are_str(value) is True
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda value: guards.StrList(["a", 1]),  # noqa: ARG005
+        lambda value: value.append(1),
+        lambda value: value.insert(0, 1),
+        lambda value: value.extend(iter(["b", 1])),
+        lambda value: value.__iadd__([1]),
+        lambda value: value.__setitem__(0, 1),
+        lambda value: value.__setitem__(slice(0, 1), ["b", 1]),
+    ],
+)
+def test_str_list_invalid_element(operation: Callable[[guards.StrList], Any]) -> None:
+    value = guards.StrList(["a"])
+    with pytest.raises(TypeError, match="Element 1 is not a string"):
+        operation(value)
+    assert value == ["a"]
@@ -0,0 +1,243 @@
+import asyncio
+import contextlib
+import functools
+from collections.abc import Iterator
+
+import pytest
+
+from dev_utils import profiling
+
+
+class FakeClock:  # noqa: D101
+    def __init__(self, step: int = 1_000) -> None:
+        self.value = 0
+        self.step = step
+
+    def __call__(self) -> int:  # noqa: D102
+        self.value += self.step
+        return self.value
+
+
+def _parse(value: str) -> int:
+    return int(value)
+
+
+@pytest.mark.parametrize(
+    ("values", "percent", "expected"),
+    [
+        ([], 50, 0),
+        ([5], 50, 5),
+        ([1, 2, 3, 4, 100], 50, 10),
+        ([1, 2, 3, 4, 100], 99, 100),
+        ([1, 2, 3, 4, 100], 0, 10),
+        ([1, 2], 50, 2),
+        ([15, 25, 35, 45], 50, 30),
+        ([15, 25, 35, 45], 100, 45),
+        ([1_000], 50, 1_000),
+    ],
+)
+def test_histogram_percentile(values: list[int], percent: float, expected: int) -> None:
+    histogram = profiling.Histogram([10, 20, 30, 40])
+    for value in values:
+        histogram.record(value)
+    assert histogram.percentile(percent) == expected
+    assert histogram.count == len(values)
+    assert histogram.total == sum(values)
+    assert histogram.max == max(values, default=0)
+
+
+def test_histogram_counts() -> None:
+    histogram = profiling.Histogram([10, 20])
+    for value in (0, 9, 10, 19, 20, 1_000):
+        histogram.record(value)
+    assert histogram.counts == [2, 2, 2]
+    assert histogram.mean == 1_058 / 6
+    histogram.reset()
+    assert histogram.counts == [0, 0, 0]
+    assert (histogram.count, histogram.total, histogram.max) == (0, 0, 0)
+    assert histogram.mean == 0
+
+
+def test_default_bounds() -> None:
+    bounds = profiling.DEFAULT_BOUNDS
+    assert list(bounds) == sorted(set(bounds))
+    assert bounds[0] == 64  # noqa: PLR2004
+    assert bounds[-1] > 15 * 60 * 10**9
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(0, "0.0ns"), (999, "999.0ns"), (1_500, "1.5us"), (2_500_000, "2.5ms"), (3 * 10**9, "3.0s")],
+)
+def test_format_duration(value: float, expected: str) -> None:
+    assert profiling.format_duration(value) == expected
+
+
+def test_profile() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+    parse = profiler.profile(_parse)
+    assert parse("1") == 1
+    assert parse("2") == 2  # noqa: PLR2004
+    with pytest.raises(ValueError, match="invalid literal"):
+        parse("a")
+    assert parse.__name__ == "_parse"
+    stats = profiler.get_stats("tests.test_profiling._parse")
+    assert (stats.calls, stats.errors, stats.total) == (3, 1, 3_000)
+    assert stats.percentile(50) == 1_000  # noqa: PLR2004
+    assert profiler.stats == {"tests.test_profiling._parse": stats}
+
+
+def test_profile_label() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+
+    @profiler.profile(label="parse")
+    def parse(value: str) -> int:
+        return int(value)
+
+    parse("1")
+    assert profiler.get_stats("parse").calls == 1
+
+
+def test_profile_callable_object() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+    profiler.profile(functools.partial(_parse, "1"))()
+    assert profiler.get_stats("functools.partial").calls == 1
+
+
+def test_profile_coroutine_function() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+
+    @profiler.profile
+    async def parse(value: str) -> int:
+        await asyncio.sleep(0)
+        return int(value)
+
+    assert asyncio.run(parse("1")) == 1
+    with pytest.raises(ValueError, match="invalid literal"):
+        asyncio.run(parse("a"))
+    stats = profiler.get_stats(f"tests.test_profiling.{parse.__qualname__}")
+    assert (stats.calls, stats.errors) == (2, 1)
+
+
+def test_profile_generator_function() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+
+    @profiler.profile(label="parse")
+    def parse(*values: str) -> Iterator[int]:
+        for value in values:
+            yield int(value)
+
+    items = parse("1", "2")
+    stats = profiler.get_stats("parse")
+    assert stats.calls == 0
+    assert list(items) == [1, 2]
+    with pytest.raises(ValueError, match="invalid literal"):
+        list(parse("1", "a"))
+    items = parse("1", "a")
+    assert next(items) == 1
+    items.close()
+    assert (stats.calls, stats.errors) == (3, 1)
+
+
+def test_profile_does_not_count_base_exceptions() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+
+    @profiler.profile(label="interrupt")
+    def interrupt() -> None:
+        raise KeyboardInterrupt
+
+    @profiler.profile(label="cancel")
+    async def cancel() -> None:
+        raise asyncio.CancelledError
+
+    with pytest.raises(KeyboardInterrupt):
+        interrupt()
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel())
+    with pytest.raises(KeyboardInterrupt), profiler.block("block"):
+        raise KeyboardInterrupt
+    for label in ("interrupt", "cancel", "block"):
+        stats = profiler.get_stats(label)
+        assert (stats.calls, stats.errors) == (1, 0)
+
+
+def test_block() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock(step=500_000_000))
+    with profiler.block("read", size=1024):
+        pass
+    with pytest.raises(KeyError), profiler.block("read", size=1024):
+        raise KeyError
+    stats = profiler.get_stats("read")
+    assert (stats.calls, stats.errors, stats.size, stats.total) == (2, 1, 2048, 10**9)
+    report = profiler.report().splitlines()
+    assert report[0].split() == [
+        "label",
+        "calls",
+        "errors",
+        "total",
+        "mean",
+        "p50",
+        "p90",
+        "p99",
+        "max",
+        "size",
+        "throughput",
+    ]
+    assert report[1].split() == [
+        "read",
+        "2",
+        "1",
+        "1.0s",
+        "500.0ms",
+        "500.0ms",
+        "500.0ms",
+        "500.0ms",
+        "500.0ms",
+        "2Kb",
+        "2Kb/s",
+    ]
+    profiler.reset()
+    assert (stats.calls, stats.errors, stats.size) == (0, 0, 0)
+
+
+def test_report_sorted_by_total() -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+    profiler.profile(label="fast")(_parse)("1")
+    parse = profiler.profile(label="slow")(_parse)
+    parse("1")
+    parse("2")
+    lines = profiler.report(percentiles=[50]).splitlines()
+    assert [line.split()[0] for line in lines] == ["label", "slow", "fast"]
+    assert lines[1].split()[-2:] == ["-", "-"]
+
+
+def test_disabled() -> None:
+    profiler = profiling.Profiler(enabled=False)
+    assert profiler.profile(_parse) is _parse
+    assert profiler.profile(label="parse")(_parse) is _parse
+    assert isinstance(profiler.block("read"), contextlib.nullcontext)
+    assert profiler.stats == {}
+
+
+@pytest.mark.parametrize(("value", "expected"), [("true", True), ("0", False), (None, False)])
+def test_enabled_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+    value: str | None,
+    expected: bool,  # noqa: FBT001
+) -> None:
+    if value is None:
+        monkeypatch.delenv(profiling.PROFILING_ENV, raising=False)
+    else:
+        monkeypatch.setenv(profiling.PROFILING_ENV, value)
+    assert profiling.Profiler().enabled is expected
+
+
+def test_default_profiler(monkeypatch: pytest.MonkeyPatch) -> None:
+    profiler = profiling.Profiler(enabled=True, clock=FakeClock())
+    monkeypatch.setattr(profiling, "_profiler", profiler)
+    assert profiling.get_profiler() is profiler
+    profiling.profile(_parse)("1")
+    profiling.profile(label="parse")(_parse)("1")
+    with profiling.profile_block("block"):
+        pass
+    assert sorted(profiler.stats) == ["block", "parse", "tests.test_profiling._parse"]
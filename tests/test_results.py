@@ -1,3 +1,9 @@
+import asyncio
+import functools
+import inspect
+import pickle
+from collections.abc import Callable, Iterator
+
 import pytest
 
 from dev_utils import results
@@ -34,3 +40,276 @@ def test_error() -> None:
     assert result != other_ne_result
     assert result != 25  # noqa: PLR2004
     assert repr(result) == "Err(TypeError('string'))"
+
+
+def test_results_are_slotted() -> None:
+    assert not hasattr(results.Ok(25), "__dict__")
+    assert not hasattr(results.Err(TypeError()), "__dict__")
+
+
+def test_shared_ok_instances() -> None:
+    assert results.Ok(None) == results.OK_NONE
+    assert results.Ok(True) == results.OK_TRUE  # noqa: FBT003
+    assert results.Ok(False) == results.OK_FALSE  # noqa: FBT003
+    assert results.OK_NONE.unwrap() is None
+
+
+def test_pickle_roundtrip() -> None:
+    assert pickle.loads(pickle.dumps(results.Ok(25))) == results.Ok(25)  # noqa: S301
+    err = results.Err(TypeError("a"))
+    assert pickle.loads(pickle.dumps(err)) == err  # noqa: S301
+
+
+@pytest.mark.parametrize(
+    ("result", "expected_result"),
+    [
+        (results.Ok(25), 25),
+        (results.Err(TypeError("string")), "string"),
+    ],
+)
+def test_match_dispatch(result: results.Result[int, TypeError], expected_result: object) -> None:
+    match result:
+        case results.Ok(value):
+            assert value == expected_result
+        case results.Err(err):
+            assert str(err) == expected_result
+
+
+def test_collect() -> None:
+    assert results.collect(some_func(i) for i in range(3)) == results.Ok([0, 1, 2])
+    assert results.collect([]) == results.Ok([])
+
+
+def test_collect_stops_on_first_err() -> None:
+    consumed: list[int | str] = []
+
+    def gen() -> Iterator[results.Result[int, TypeError]]:
+        for value in (1, "a", "b", 2):
+            consumed.append(value)
+            yield some_func(value)
+
+    assert results.collect(gen()) == results.Err(TypeError("a"))
+    assert consumed == [1, "a"]
+
+
+def test_partition() -> None:
+    values, errors = results.partition(some_func(v) for v in (1, "a", 2, "b"))
+    assert values == [1, 2]
+    assert [err.args for err in errors] == [("a",), ("b",)]
+
+
+def test_iter_oks_and_errs() -> None:
+    items = [some_func(v) for v in (1, "a", 2, "b")]
+    oks = results.iter_oks(iter(items))
+    errs = results.iter_errs(iter(items))
+    assert isinstance(oks, Iterator)
+    assert isinstance(errs, Iterator)
+    assert list(oks) == [1, 2]
+    assert [str(err) for err in errs] == ["a", "b"]
+
+
+async def _async_some_func(value: int | str, delay: float = 0) -> int:
+    await asyncio.sleep(delay)
+    if isinstance(value, str):
+        raise TypeError(value)
+    return value
+
+
+def test_from_awaitable() -> None:
+    assert asyncio.run(results.from_awaitable(_async_some_func(1))) == results.Ok(1)
+    assert asyncio.run(results.from_awaitable(_async_some_func("a"))) == results.Err(TypeError("a"))
+    with pytest.raises(TypeError):
+        asyncio.run(results.from_awaitable(_async_some_func("a"), KeyError))
+
+
+def test_async_catch() -> None:
+    wrapped = results.async_catch(TypeError)(_async_some_func)
+    assert wrapped.__name__ == _async_some_func.__name__
+    assert asyncio.run(wrapped(1)) == results.Ok(1)
+    assert asyncio.run(wrapped("a")) == results.Err(TypeError("a"))
+    with pytest.raises(TypeError):
+        asyncio.run(results.async_catch(KeyError)(_async_some_func)("a"))
+
+
+@pytest.mark.parametrize("limit", [None, 1, 2, 100])
+def test_gather_results(limit: int | None) -> None:
+    values: list[int | str] = [1, "a", 2, "b", 3]
+    awaitables = (_async_some_func(value, delay=0.001 * (5 - i)) for i, value in enumerate(values))
+    assert asyncio.run(results.gather_results(awaitables, limit=limit)) == [
+        results.Ok(1),
+        results.Err(TypeError("a")),
+        results.Ok(2),
+        results.Err(TypeError("b")),
+        results.Ok(3),
+    ]
+
+
+def test_gather_results_limit() -> None:
+    running = max_running = 0
+
+    async def task() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    asyncio.run(results.gather_results([task() for _ in range(10)], limit=3))
+    assert max_running == 3  # noqa: PLR2004
+
+
+def test_gather_results_empty_and_invalid_limit() -> None:
+    assert asyncio.run(results.gather_results([])) == []
+    with pytest.raises(ValueError, match="limit"):
+        asyncio.run(results.gather_results([], limit=0))
+
+
+def test_gather_results_propagates_not_caught_exceptions() -> None:
+    with pytest.raises(TypeError):
+        asyncio.run(results.gather_results([_async_some_func("a")], KeyError))
+    awaitables = [_async_some_func("a"), *(_async_some_func(value) for value in range(5))]
+    with pytest.raises(TypeError):
+        asyncio.run(results.gather_results(awaitables, KeyError, limit=2))
+    assert all(
+        inspect.getcoroutinestate(awaitable) == inspect.CORO_CLOSED for awaitable in awaitables
+    )
+
+
+def _raising_func(value: int | str) -> int:
+    if isinstance(value, str):
+        raise TypeError(value)
+    return value
+
+
+def _raising_gen(values: list[int | str]) -> Iterator[int]:
+    for value in values:
+        yield _raising_func(value)
+
+
+def test_catch() -> None:
+    wrapped = results.catch(TypeError)(_raising_func)
+    assert wrapped.__name__ == _raising_func.__name__
+    assert wrapped(1) == results.Ok(1)
+    assert wrapped("a") == results.Err(TypeError("a"))
+    with pytest.raises(TypeError):
+        results.catch(KeyError)(_raising_func)("a")
+
+
+def test_catch_default_exceptions() -> None:
+    assert results.catch()(_raising_func)("a") == results.Err(TypeError("a"))
+
+
+def test_catch_generator() -> None:
+    wrapped = results.catch(TypeError)(_raising_gen)
+    assert list(wrapped([1, 2])) == [results.Ok(1), results.Ok(2)]
+    assert list(wrapped([1, "a", 2])) == [results.Ok(1), results.Err(TypeError("a"))]
+    with pytest.raises(TypeError):
+        list(results.catch(KeyError)(_raising_gen)([1, "a"]))
+
+
+def test_catch_coroutine() -> None:
+    wrapped = results.catch(TypeError)(_async_some_func)
+    assert asyncio.run(wrapped(1)) == results.Ok(1)
+    assert asyncio.run(wrapped("a")) == results.Err(TypeError("a"))
+
+
+def _complex_signature(
+    a: int,
+    /,
+    b: int,
+    c: int = 3,
+    *args: int,
+    d: int,
+    e: int = 5,
+    **kwargs: int,
+) -> tuple[object, ...]:
+    return (a, b, c, args, d, e, kwargs)
+
+
+def _no_positional_only(*, a: int, b: list[int] = []) -> tuple[int, list[int]]:  # noqa: B006
+    return (a, b)
+
+
+def test_catch_keeps_signature() -> None:
+    wrapped = results.catch()(_complex_signature)
+    assert wrapped(1, 2, d=4) == results.Ok((1, 2, 3, (), 4, 5, {}))
+    assert wrapped(1, b=2, c=6, d=4, f=7) == results.Ok((1, 2, 6, (), 4, 5, {"f": 7}))
+    assert wrapped(1, 2, 6, 7, 8, d=4, e=9) == results.Ok((1, 2, 6, (7, 8), 4, 9, {}))
+    assert isinstance(wrapped(a=1, b=2, d=4), results.Err)  # type: ignore reportCallIssue
+    assert inspect.signature(wrapped) == inspect.signature(_complex_signature)
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "kwargs", "expected_result"),
+    [
+        (_no_positional_only, (), {"a": 1}, (1, [])),
+        (int, ("1",), {}, 1),
+        (len, ([1, 2],), {}, 2),
+    ],
+)
+def test_catch_signatures(
+    func: Callable[..., object],
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+    expected_result: object,
+) -> None:
+    assert results.catch()(func)(*args, **kwargs) == results.Ok(expected_result)
+
+
+def _inject_session(func: Callable[..., int]) -> Callable[..., int]:
+    @functools.wraps(func)
+    def wrapper(*args: int) -> int:
+        return func(*args, session="session")
+
+    return wrapper
+
+
+@_inject_session
+def _needs_session(value: int, *, session: str) -> int:
+    assert session == "session"
+    return value
+
+
+def test_catch_signature_changing_decorator() -> None:
+    assert results.catch()(_needs_session)(1) == results.Ok(1)
+
+
+def _raise_chained() -> None:
+    try:
+        _raising_func("inner")
+    except TypeError as exc:
+        msg = "outer"
+        raise ValueError(msg) from exc
+
+
+@pytest.mark.parametrize("keep_stack", [True, False])
+def test_err_lightweight(keep_stack: bool) -> None:  # noqa: FBT001
+    with pytest.raises(ValueError, match="outer") as exc_info:
+        _raise_chained()
+    result = results.Err.lightweight(exc_info.value, keep_stack=keep_stack)
+    err = result.err()
+    assert result == results.Err(ValueError("outer"))
+    assert err.__traceback__ is None
+    assert err.__cause__ is not None
+    assert err.__cause__.__traceback__ is None
+    if keep_stack:
+        assert "_raise_chained" in err.__notes__[0]
+        assert "_raising_func" in err.__cause__.__notes__[0]
+    else:
+        assert not hasattr(err, "__notes__")
+
+
+def _raise_group() -> None:
+    try:
+        _raising_func("a")
+    except TypeError as exc:
+        msg = "group"
+        raise ExceptionGroup(msg, [exc]) from None
+
+
+def test_strip_traceback_exception_group() -> None:
+    with pytest.raises(ExceptionGroup) as exc_info:
+        _raise_group()
+    group = results.strip_traceback(exc_info.value)
+    assert group.__traceback__ is None
+    assert group.exceptions[0].__traceback__ is None